@@ -0,0 +1,150 @@
+"""
+This program implements an asyncio consumer for IPC with many child processes.
+Every child writes to its own Pipe, and one event loop watches all of the read ends with loop.add_reader
+instead of blocking on a single queue. Received messages go into a bounded buffer: when it is full the
+consumer stops reading the pipes, so the pipes fill up and the children block (backpressure) until the
+parent catches up. Child exits are detected through the process sentinels, so a child that dies early
+ends its stream instead of leaving the parent waiting for messages that will never come.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import asyncio
+import time
+from collections import deque
+from multiprocessing import Pipe, Process
+
+
+class PipeProducer:
+    """Gives the write end of a Pipe the put() method the child processes use on queues."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def put(self, message):
+        self.conn.send_bytes(message.encode() if isinstance(message, str) else message)
+
+    def close(self):
+        self.conn.close()
+
+
+class AsyncMessageConsumer:
+    """
+    Multiplexes the pipes of many child processes on the running event loop.
+    Iterate with `async for name, data in consumer` to receive (child name, message bytes) pairs;
+    the iteration ends once every child has exited and its pipe has been drained.
+    Create it inside a coroutine, since it registers its callbacks on the running loop.
+    """
+
+    def __init__(self, max_buffered=1024):
+        if max_buffered <= 0:
+            raise ValueError("The buffer must hold at least one message")
+        self.loop = asyncio.get_running_loop()
+        self.max_buffered = max_buffered
+        self.buffer = deque()
+        self.readers = {}  # File descriptor -> (child name, read end of its pipe)
+        self.paused = set()  # Descriptors not watched while the buffer is full
+        self.pending = 0  # Open pipes plus running children
+        self.exit_codes = {}  # Child name -> exit code
+        self.waiter = None  # Future the consumer sleeps on while the buffer is empty
+
+    def add_child(self, process, reader, name=None):
+        """Watch a started child process and the read end of its pipe."""
+        name = process.name if name is None else name
+        fd = reader.fileno()
+        self.readers[fd] = (name, reader)
+        self.loop.add_reader(fd, self._read, fd)
+        self.loop.add_reader(process.sentinel, self._exited, process, name)
+        self.pending += 2
+
+    def _read(self, fd):
+        # One message per callback: the loop calls again while the pipe stays readable, which keeps children fair
+        if len(self.buffer) >= self.max_buffered:
+            self.loop.remove_reader(fd)
+            self.paused.add(fd)
+            return
+        name, reader = self.readers[fd]
+        try:
+            data = reader.recv_bytes()
+        except EOFError:
+            self.loop.remove_reader(fd)
+            del self.readers[fd]
+            reader.close()
+            self.pending -= 1
+        else:
+            self.buffer.append((name, data))
+        self._wake()
+
+    def _exited(self, process, name):
+        self.loop.remove_reader(process.sentinel)
+        process.join()  # The sentinel is ready, so this only reaps the child
+        self.exit_codes[name] = process.exitcode
+        self.pending -= 1
+        self._wake()
+
+    def _wake(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def _resume(self):
+        # Watch the paused pipes again once there is room in the buffer
+        for fd in self.paused:
+            self.loop.add_reader(fd, self._read, fd)
+        self.paused.clear()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.buffer:
+            if self.pending == 0:
+                raise StopAsyncIteration
+            self.waiter = self.loop.create_future()
+            await self.waiter
+        item = self.buffer.popleft()
+        if self.paused and len(self.buffer) < self.max_buffered:
+            self._resume()
+        return item
+
+
+def start_pipe_children(target, num_children, *args):
+    """
+    Start num_children processes running target(PipeProducer, child number, *args), each with its own Pipe.
+    Returns the processes and the read ends; the parent's copies of the write ends are closed.
+    """
+    processes, readers = [], []
+    for i in range(num_children):
+        reader, writer = Pipe(duplex=False)
+        p = Process(target=target, args=(PipeProducer(writer), i+1) + args)
+        p.start()
+        writer.close()
+        processes.append(p)
+        readers.append(reader)
+    return processes, readers
+
+
+def _send_messages(producer, process_number, num_messages):
+    for i in range(num_messages):
+        producer.put(f"Message {i+1} from child process {process_number}")
+
+
+async def _count_messages(processes, readers, max_buffered):
+    consumer = AsyncMessageConsumer(max_buffered)
+    for process, reader in zip(processes, readers):
+        consumer.add_child(process, reader)
+    received = 0
+    async for _ in consumer:
+        received += 1
+    return received, consumer.exit_codes
+
+
+if __name__ == '__main__':
+    num_children, num_messages = 200, 500
+    start = time.perf_counter()
+    processes, readers = start_pipe_children(_send_messages, num_children, num_messages)
+    received, exit_codes = asyncio.run(_count_messages(processes, readers, max_buffered=256))
+    elapsed = time.perf_counter() - start
+
+    failed = [name for name, code in exit_codes.items() if code != 0]
+    print(f"Received {received} messages from {len(exit_codes)} children in {elapsed:.2f} s")
+    print(f"Children that exited with an error: {failed or 'none'}")
@@ -0,0 +1,228 @@
+"""
+This program is a single non-interactive benchmark runner for the simulators in this repository.
+It times Round Robin scheduling, address translation, the IPC parent/child programs, the writer/editor
+threading simulation and the multiprocessing workloads with parameterized problem sizes. Each benchmark
+gets warm-up runs and repeated timed runs with all console output suppressed, plus one extra run under
+tracemalloc for the peak memory of the parent process. Results can be saved as a JSON baseline and
+later runs compared against it.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from multiprocessing import Process
+
+import IPCUsingMessageQueueVersion2
+import Multiprocessing
+import RoundRobinScheduling
+import RoundRobinSchedulingVersion2
+import Threading
+import TwoLevelPageTableTLBSimulation as sim
+from WorkloadRunner import WorkloadRunner
+
+# Problem size of every benchmark (what the size means is noted next to it)
+DEFAULT_SIZES = {
+    "round_robin": 2000,  # Processes, bursts of 1-100 units, quantum 4
+    "round_robin_v2": 2000,  # Processes, quiet mode
+    "translate_address": 100000,  # Addresses translated one by one
+    "simulate_address_access": 100000,  # Addresses in one access pattern
+    "ipc_queue": 5000,  # Messages per child, 4 children, multiprocessing.Queue
+    "ipc_pipe": 5000,  # Messages per child, 4 children, batched frames over pipes
+    "threading": 200,  # Writers, 4 editors, 3 slots, thread pool backend, 1/1000 of the simulated times
+    "multiprocessing": 20,  # CPU-bound tasks, one new process per task as in Multiprocessing.py
+    "workload_runner": 20,  # The same CPU-bound tasks on a persistent process pool
+}
+
+
+def _round_robin(size, rng):
+    processes = [[i + 1, rng.randint(1, 100)] for i in range(size)]
+    return lambda: RoundRobinScheduling.round_robin_scheduling(processes, 4)
+
+
+def _round_robin_v2(size, rng):
+    processes = [[i + 1, rng.randint(1, 100)] for i in range(size)]
+    return lambda: RoundRobinSchedulingVersion2.round_robin_scheduling(processes, 4, quiet=True)
+
+
+def _addresses(size, rng):
+    address_space = sim.PAGE_TABLE_LEVEL_1_SIZE * sim.PAGE_TABLE_LEVEL_2_SIZE * sim.FRAME_SIZE
+    return [rng.randrange(address_space) for _ in range(size)]
+
+
+def _translate_address(size, rng):
+    addresses = _addresses(size, rng)
+
+    def run():
+        for virtual_address in addresses:
+            sim.translate_address(virtual_address, verbose=False)
+    return run
+
+
+def _simulate_address_access(size, rng):
+    addresses = _addresses(size, rng)
+    return lambda: sim.simulate_address_access(addresses, verbose=False)
+
+
+def _ipc(transport):
+    def factory(size, rng):
+        return lambda: IPCUsingMessageQueueVersion2.parentProcess(4, size, transport, delay=0)
+    return factory
+
+
+def _threading(size, rng):
+    return lambda: Threading.main(size, 4, 3, "pool", verbose=False, time_scale=0.001)
+
+
+def _multiprocessing(size, rng):
+    def run():
+        processes = [Process(target=Multiprocessing.cpu_bound_task, args=(f'CPU-Worker-{i}',)) for i in range(size)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    return run
+
+
+def _workload_runner(size, rng):
+    def run():
+        with WorkloadRunner() as runner:
+            runner.run([("cpu", f"CPU-Worker-{i}") for i in range(size)])
+    return run
+
+
+BENCHMARKS = {
+    "round_robin": _round_robin,
+    "round_robin_v2": _round_robin_v2,
+    "translate_address": _translate_address,
+    "simulate_address_access": _simulate_address_access,
+    "ipc_queue": _ipc("queue"),
+    "ipc_pipe": _ipc("pipe"),
+    "threading": _threading,
+    "multiprocessing": _multiprocessing,
+    "workload_runner": _workload_runner,
+}
+
+
+@contextlib.contextmanager
+def suppressed_output():
+    """Send everything printed (also by forked children, which inherit sys.stdout) to os.devnull."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def run_benchmark(name, size, warmup=1, repeats=5, seed=2024):
+    """Time one benchmark: warm-up runs, then `repeats` timed runs, then one run under tracemalloc."""
+    run = BENCHMARKS[name](size, random.Random(seed))
+    times = []
+    with suppressed_output():
+        for _ in range(warmup):
+            run()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+        # Measured separately, since tracing allocations slows the run down
+        tracemalloc.start()
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "size": size,
+        "repeats": repeats,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "peak_memory": peak_memory,
+    }
+
+
+def run_suite(names=None, sizes=None, warmup=1, repeats=5, seed=2024, progress=True):
+    """Run the named benchmarks (default: all) and return {name: result}."""
+    sizes = {**DEFAULT_SIZES, **(sizes or {})}
+    results = {}
+    for name in names or BENCHMARKS:
+        if progress:
+            print(f"Running {name} (size {sizes[name]})...", file=sys.stderr)
+        results[name] = run_benchmark(name, sizes[name], warmup, repeats, seed)
+    return results
+
+
+def compare_results(results, baseline, threshold=0.10):
+    """
+    Compare median times with a baseline. Returns rows of (name, baseline median, median, change)
+    and the names whose median got slower by more than `threshold` (a fraction).
+    Benchmarks run with a different size than in the baseline are skipped.
+    """
+    rows, regressions = [], []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or base["size"] != result["size"]:
+            continue
+        change = result["median"] / base["median"] - 1 if base["median"] > 0 else 0.0
+        rows.append((name, base["median"], result["median"], change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def print_results(results):
+    """Display the timing and memory results."""
+    print("Benchmark\t\t\tSize\tMedian (s)\tMin (s)\t\tStdev (s)\tPeak Memory (KiB)")
+    for name, result in results.items():
+        print(f"{name:<24}\t{result['size']}\t{result['median']:.4f}\t\t{result['min']:.4f}"
+              f"\t\t{result['stdev']:.4f}\t\t{result['peak_memory'] / 1024:.1f}")
+
+
+def print_comparison(rows, regressions):
+    """Display the change of every median time against the baseline."""
+    print("\nBenchmark\t\t\tBaseline (s)\tCurrent (s)\tChange")
+    for name, base_median, median, change in rows:
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:<24}\t{base_median:.4f}\t\t{median:.4f}\t\t{change * 100:+.1f}%{flag}")
+
+
+def _parse_size(text):
+    name, _, value = text.partition("=")
+    if name not in BENCHMARKS or not value.isdigit():
+        raise argparse.ArgumentTypeError(f"expected NAME=SIZE with NAME one of {', '.join(BENCHMARKS)}")
+    return name, int(value)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the simulators without any interactive input.")
+    parser.add_argument("benchmarks", nargs="*", help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--size", type=_parse_size, action="append", default=[], metavar="NAME=SIZE",
+                        help="problem size of one benchmark (repeatable)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before timing")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--seed", type=int, default=2024, help="seed for the generated inputs")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown counted as a regression (0.10 = 10%%)")
+    args = parser.parse_args()
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_suite(args.benchmarks, dict(args.size), args.warmup, args.repeats, args.seed)
+    print_results(results)
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            rows, regressions = compare_results(results, json.load(file), args.threshold)
+        print_comparison(rows, regressions)
+        if regressions:
+            sys.exit(1)
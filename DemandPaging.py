@@ -0,0 +1,184 @@
+"""
+This program adds demand paging to the address translation simulator.
+Instead of a page table filled with random (and possibly colliding) frames, pages are loaded on first use
+into a finite pool of physical frames taken from a free list. When the pool is full a victim page is chosen
+by LRU, CLOCK or working-set (WSClock) replacement; dirty victims are written back and their TLB entries are
+shot down. Page faults, evictions and write-backs are counted. An access costs O(1) with LRU and amortized O(1)
+with CLOCK; with working-set a fault costs O(1) while every resident page is still in the working set, and at
+most one revolution of the clock hand (O(frames)) once some page has left it.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import random
+from collections import OrderedDict
+
+from TLBPolicies import TLB
+from TwoLevelPageTableTLBSimulation import FRAME_SIZE, OFFSET_BITS, TLB_SIZE
+
+REPLACEMENT_POLICIES = ("lru", "clock", "working-set")
+ASID_SHIFT = 64  # TLB keys are (asid << ASID_SHIFT) | page, so a TLB can be shared by several address spaces
+
+
+class DemandPagingSimulator:
+    """Translates virtual addresses with a TLB, loading pages into a finite frame pool on demand."""
+
+    def __init__(self, num_frames, policy="lru", tlb=None, working_set_window=1000, offset_bits=OFFSET_BITS, asid=0):
+        if num_frames <= 0:
+            raise ValueError("The frame pool needs at least one frame")
+        if policy not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Unknown page replacement policy: {policy}")
+
+        self.num_frames = num_frames
+        self.policy = policy
+        self.tlb = tlb if tlb is not None else TLB(TLB_SIZE)
+        self.working_set_window = working_set_window
+        self.offset_bits = offset_bits
+        self.offset_mask = (1 << offset_bits) - 1
+        self.asid_tag = asid << ASID_SHIFT  # Address space tag of this simulator's TLB entries
+
+        self.free_frames = list(range(num_frames - 1, -1, -1))  # Free list, frame 0 is handed out first
+        self.page_table = {}  # Resident page -> frame
+        self.page_of_frame = [None] * num_frames
+        self.dirty = [False] * num_frames
+        self.referenced = [False] * num_frames  # Reference bit for CLOCK / working-set
+        self.last_use = [0] * num_frames  # Virtual time of the last use, for working-set
+        self.lru = OrderedDict()  # Resident pages in LRU order (LRU policy only)
+        self.use_order = OrderedDict()  # Frames in order of last use (working-set policy only)
+        self.hand = 0  # Clock hand over the frames
+        self.time = 0  # Virtual time: number of accesses so far
+
+        self.accesses = 0
+        self.tlb_hits = 0
+        self.page_faults = 0
+        self.evictions = 0
+        self.write_backs = 0
+
+    def access(self, virtual_address, write=False):
+        """
+        Translate one virtual address, loading its page on a page fault.
+        Returns a tuple with the physical address, whether it was a TLB hit, and whether it caused a page fault.
+        """
+        page = virtual_address >> self.offset_bits
+        self.accesses += 1
+        self.time += 1
+        page_fault = False
+
+        frame = self.page_table.get(page)
+        if frame is None:
+            page_fault = True
+            frame = self._load(page)
+
+        is_tlb_hit = self.tlb.access(self.asid_tag | page, frame)
+        if is_tlb_hit:
+            self.tlb_hits += 1
+
+        # The hardware sets the accessed (and dirty) bits on every access
+        self.referenced[frame] = True
+        self.last_use[frame] = self.time
+        if write:
+            self.dirty[frame] = True
+        if self.policy == "lru":
+            self.lru.move_to_end(page)
+        elif self.policy == "working-set":
+            self.use_order.move_to_end(frame)
+
+        return (frame << self.offset_bits) | (virtual_address & self.offset_mask), is_tlb_hit, page_fault
+
+    def _load(self, page):
+        # Handle a page fault: take a free frame, or evict a victim page to make room
+        self.page_faults += 1
+        frame = self.free_frames.pop() if self.free_frames else self._evict()
+        self.page_table[page] = frame
+        self.page_of_frame[frame] = page
+        self.dirty[frame] = False
+        self.referenced[frame] = False
+        if self.policy == "lru":
+            self.lru[page] = frame
+        elif self.policy == "working-set":
+            self.use_order[frame] = None
+        return frame
+
+    def _evict(self):
+        # Choose a victim, write it back if dirty, and shoot down its TLB entry
+        if self.policy == "lru":
+            page, frame = self.lru.popitem(last=False)
+        elif self.policy == "clock":
+            frame = self._clock_victim()
+        else:
+            frame = self._working_set_victim()
+        page = self.page_of_frame[frame]
+
+        self.evictions += 1
+        if self.dirty[frame]:
+            self.write_backs += 1
+        del self.page_table[page]
+        self.tlb.invalidate(self.asid_tag | page)
+        return frame
+
+    def _clock_victim(self):
+        # Second chance: clear reference bits until an unreferenced frame comes under the hand
+        while self.referenced[self.hand]:
+            self.referenced[self.hand] = False
+            self.hand = (self.hand + 1) % self.num_frames
+        frame = self.hand
+        self.hand = (frame + 1) % self.num_frames
+        return frame
+
+    def _working_set_victim(self):
+        # WSClock: evict the first unreferenced frame that has left the working set (older than the window),
+        # or the least recently used frame. Nothing can be found while that frame is still in the working set,
+        # so the sweep is skipped then; otherwise it is bounded by one revolution of the hand
+        oldest = next(iter(self.use_order))
+        if self.time - self.last_use[oldest] <= self.working_set_window:
+            return oldest
+        for _ in range(self.num_frames):
+            frame = self.hand
+            self.hand = (frame + 1) % self.num_frames
+            if self.referenced[frame]:
+                self.referenced[frame] = False
+            elif self.time - self.last_use[frame] > self.working_set_window:
+                return frame
+        return oldest
+
+    @property
+    def fault_rate(self):
+        return self.page_faults / self.accesses * 100 if self.accesses > 0 else 0
+
+
+def simulate_demand_paging(access_pattern, num_frames, policy="lru", writes=None, **options):
+    """
+    Replay an access pattern (and optional matching sequence of write flags) through a
+    DemandPagingSimulator and return it with its counters.
+    """
+    simulator = DemandPagingSimulator(num_frames, policy, **options)
+    if writes is None:
+        for virtual_address in access_pattern:
+            simulator.access(virtual_address)
+    else:
+        for virtual_address, write in zip(access_pattern, writes):
+            simulator.access(virtual_address, write)
+    return simulator
+
+
+def print_paging_results(simulator):
+    """Display the demand paging counters."""
+    print(f"Total Accesses: {simulator.accesses}")
+    print(f"TLB Hits: {simulator.tlb_hits}")
+    print(f"Page Faults: {simulator.page_faults}")
+    print(f"Evictions: {simulator.evictions}")
+    print(f"Write-Backs: {simulator.write_backs}")
+    print(f"Page Fault Rate: {simulator.fault_rate:.2f}%")
+
+
+if __name__ == '__main__':
+    num_pages = 64
+    access_pattern = [random.randint(0, num_pages * FRAME_SIZE - 1) for _ in range(100000)]
+    writes = [random.random() < 0.3 for _ in access_pattern]
+
+    for policy in REPLACEMENT_POLICIES:
+        print(f"\nPolicy: {policy}")
+        print("Frames\tPage Faults\tWrite-Backs\tFault Rate")
+        for num_frames in (8, 16, 32, 64):
+            simulator = simulate_demand_paging(access_pattern, num_frames, policy, writes, working_set_window=100)
+            print(f"{num_frames}\t{simulator.page_faults}\t\t{simulator.write_backs}\t\t{simulator.fault_rate:.2f}%")
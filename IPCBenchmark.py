@@ -0,0 +1,172 @@
+"""
+This program benchmarks the IPC transports used by the message queue programs without any user input.
+Child processes send fixed-size messages to the parent through multiprocessing.Queue, SimpleQueue, one Pipe
+per child, or the shared-memory ring buffers, while the number of children, the message size and the message
+count are varied. Every message carries the perf_counter_ns() time it was sent at, so the parent measures the
+one-way latency of each message as well as messages/sec and bytes/sec. Results can be saved as JSON or CSV.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import argparse
+import csv
+import json
+import struct
+import time
+from array import array
+from multiprocessing import Event, Pipe, Process, Queue, SimpleQueue
+
+from MessageBatching import recv_frames
+from SharedMemoryRing import LENGTH, RingBufferQueue
+
+TRANSPORTS = ("queue", "simplequeue", "pipe", "shm")
+TIMESTAMP = struct.Struct("<Q")  # Send time in perf_counter_ns() at the start of every message
+FIELDS = ("transport", "children", "message_size", "messages", "seconds", "messages_per_sec", "bytes_per_sec",
+          "p50_latency_us", "p99_latency_us")
+
+
+def _producer(transport, channel, start, num_messages, message_size):
+    """Child process: wait for the start signal, then send num_messages timestamped messages."""
+    message = bytearray(max(message_size, TIMESTAMP.size))
+    if transport == "pipe":
+        send = channel.send_bytes
+    elif transport == "shm":
+        send = channel.put_bytes
+    else:
+        send = lambda data: channel.put(bytes(data))  # Queues pickle the message, so give them a copy
+
+    start.wait()
+    for _ in range(num_messages):
+        # perf_counter_ns() reads CLOCK_MONOTONIC on Linux, which every process on the machine shares
+        TIMESTAMP.pack_into(message, 0, time.perf_counter_ns())
+        send(message)
+    if transport == "pipe":
+        channel.close()
+
+
+def _receive(transport, channel, total):
+    """Yield every message received by the parent as a bytes-like object."""
+    if transport == "pipe":
+        for _, data in recv_frames(channel):
+            yield data
+    elif transport == "shm":
+        for _ in range(total):
+            yield channel.get_bytes()
+    else:
+        for _ in range(total):
+            yield channel.get()
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def run_benchmark(transport, num_children, message_size, num_messages):
+    """
+    Send num_messages messages of message_size bytes from each of num_children children through one transport.
+    Returns a row dictionary with throughput and latency figures.
+    """
+    message_size = max(message_size, TIMESTAMP.size)
+    if transport == "queue":
+        channel = Queue()
+    elif transport == "simplequeue":
+        channel = SimpleQueue()
+    elif transport == "pipe":
+        channel = []
+    elif transport == "shm":
+        channel = RingBufferQueue(num_children, slot_size=message_size + LENGTH.size)
+    else:
+        raise ValueError(f"Unknown transport: {transport}")
+
+    # Start the children first and release them together, so process startup is not timed
+    start = Event()
+    processes = []
+    for i in range(num_children):
+        if transport == "pipe":
+            reader, writer = Pipe(duplex=False)
+            channel.append(reader)
+            child_channel = writer
+        else:
+            child_channel = channel.producer(i) if transport == "shm" else channel
+        p = Process(target=_producer, args=(transport, child_channel, start, num_messages, message_size))
+        processes.append(p)
+        p.start()
+        if transport == "pipe":
+            writer.close()
+
+    total = num_children * num_messages
+    latencies = array('q')
+    start.set()
+    begin = time.perf_counter_ns()
+    for data in _receive(transport, channel, total):
+        latencies.append(time.perf_counter_ns() - TIMESTAMP.unpack_from(data)[0])
+    elapsed = (time.perf_counter_ns() - begin) / 1e9
+
+    for p in processes:
+        p.join()
+    if transport == "shm":
+        channel.close()
+
+    latencies = sorted(latencies)
+    return {
+        "transport": transport,
+        "children": num_children,
+        "message_size": message_size,
+        "messages": len(latencies),
+        "seconds": round(elapsed, 6),
+        "messages_per_sec": round(len(latencies) / elapsed, 1),
+        "bytes_per_sec": round(len(latencies) * message_size / elapsed, 1),
+        "p50_latency_us": round(percentile(latencies, 0.50) / 1000, 2),
+        "p99_latency_us": round(percentile(latencies, 0.99) / 1000, 2),
+    }
+
+
+def run_suite(transports=TRANSPORTS, children_counts=(1, 2, 4), message_sizes=(64, 1024), num_messages=10000):
+    """Run every combination of transport, number of children and message size; returns the result rows."""
+    rows = []
+    for transport in transports:
+        for num_children in children_counts:
+            for message_size in message_sizes:
+                rows.append(run_benchmark(transport, num_children, message_size, num_messages))
+    return rows
+
+
+def write_json(rows, path):
+    with open(path, "w") as file:
+        json.dump(rows, file, indent=2)
+
+
+def write_csv(rows, path):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def print_benchmark_table(rows):
+    """Display the benchmark results."""
+    print("Transport\tChildren\tSize\tMessages/s\tMB/s\tp50 (us)\tp99 (us)")
+    for row in rows:
+        print(f"{row['transport']:<11}\t{row['children']}\t\t{row['message_size']}\t{row['messages_per_sec']:.0f}"
+              f"\t\t{row['bytes_per_sec'] / 1e6:.2f}\t{row['p50_latency_us']:.1f}\t\t{row['p99_latency_us']:.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark IPC throughput and latency across transports.")
+    parser.add_argument("--transports", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS), help="transports to test")
+    parser.add_argument("--children", type=int, nargs="+", default=[1, 2, 4], help="numbers of child processes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 1024], help="message sizes in bytes")
+    parser.add_argument("--messages", type=int, default=10000, help="messages sent by each child")
+    parser.add_argument("--json", metavar="PATH", help="write the results to a JSON file")
+    parser.add_argument("--csv", metavar="PATH", help="write the results to a CSV file")
+    args = parser.parse_args()
+
+    rows = run_suite(args.transports, args.children, args.sizes, args.messages)
+    print_benchmark_table(rows)
+    if args.json:
+        write_json(rows, args.json)
+    if args.csv:
+        write_csv(rows, args.csv)
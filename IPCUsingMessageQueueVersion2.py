@@ -1,38 +1,104 @@
-from multiprocessing import Process, Queue
+from multiprocessing import Pipe, Process, Queue
+import asyncio
 import time
 
+from AsyncMessageConsumer import AsyncMessageConsumer, PipeProducer
+from MessageBatching import BatchWriter, iter_frame, recv_frames
+from SharedMemoryRing import RingBufferQueue
+
 """
 This program demonstrates IPC via message queue with multiple child processes.
 Author: Rahul Kumar
 Date: October 12, 2024
 """
 
-def childProcess(q, process_number, num_messages):
+def childProcess(q, process_number, num_messages, delay=0.1):
     # A child process sends multiple messages to the queue
     for i in range(num_messages):
         message = f"Message {i+1} from child process {process_number}"
         q.put(message)  # Send message to the queue
-        time.sleep(0.1)  # Simulate some delay
+        time.sleep(delay)  # Simulate some delay
+
+def batchedChildProcess(channel, process_number, num_messages, delay=0.1):
+    # Same messages as childProcess, but packed into frames that are sent when full or old enough
+    with BatchWriter(channel) as writer:
+        for i in range(num_messages):
+            writer.write(f"Message {i+1} from child process {process_number}")
+            time.sleep(delay)  # Simulate some delay
 
-def parentProcess(num_children, num_messages):
+async def collectMessagesAsync(processes, readers, max_buffered=1024):
+    # One event loop watches every child's pipe and exit sentinel, so a child that dies early ends its stream
+    consumer = AsyncMessageConsumer(max_buffered)
+    for i, (p, reader) in enumerate(zip(processes, readers)):
+        consumer.add_child(p, reader, i+1)
+    async for _, message in consumer:
+        print("Received:", message.decode())
+    for process_number, exit_code in sorted(consumer.exit_codes.items()):
+        if exit_code != 0:
+            print(f"Child process {process_number} exited with code {exit_code}")
+
+def parentProcess(num_children, num_messages, transport="queue", batch=False, delay=0.1):
     # Create a message queue to hold the messages
-    q = Queue()
+    # transport="ring" uses one shared-memory ring buffer per child instead of multiprocessing.Queue
+    # transport="pipe" gives every child its own Pipe carrying batched frames (send_bytes/recv_bytes)
+    # transport="async" gives every child its own Pipe, read by an asyncio consumer with backpressure
+    # batch=True sends batched frames through the Queue instead of one put per message
+    if transport == "queue":
+        q = Queue()
+    elif transport == "ring":
+        if batch:
+            raise ValueError("Batched frames do not fit in the ring buffer slots")
+        q = RingBufferQueue(num_children)
+    elif transport in ("pipe", "async"):
+        readers = []
+    else:
+        raise ValueError(f"Unknown transport: {transport}")
 
     # Create and start multiple child processes
     processes = []
     for i in range(num_children):
-        p = Process(target=childProcess, args=(q, i+1, num_messages))
+        if transport == "pipe":
+            reader, writer = Pipe(duplex=False)
+            p = Process(target=batchedChildProcess, args=(writer, i+1, num_messages, delay))
+            readers.append(reader)
+        elif transport == "async":
+            reader, writer = Pipe(duplex=False)
+            p = Process(target=childProcess, args=(PipeProducer(writer), i+1, num_messages, delay))
+            readers.append(reader)
+        else:
+            child_q = q.producer(i) if transport == "ring" else q  # Each child writes to its own ring
+            target = batchedChildProcess if batch else childProcess
+            p = Process(target=target, args=(child_q, i+1, num_messages, delay))
         processes.append(p)
         p.start()
+        if transport in ("pipe", "async"):
+            writer.close()  # Only the child keeps the write end, so the reader sees EOF when it is done
 
     # Collect messages from the queue
-    for _ in range(num_children * num_messages):
-        print("Received:", q.get())
+    if transport == "pipe":
+        # Frames of each child arrive in order; records are decoded straight from the frame
+        for _, frame in recv_frames(readers):
+            for record in iter_frame(frame):
+                print("Received:", str(record, "utf-8"))
+    elif transport == "async":
+        asyncio.run(collectMessagesAsync(processes, readers))
+    elif batch:
+        received = 0
+        while received < num_children * num_messages:
+            for record in iter_frame(q.get()):
+                print("Received:", str(record, "utf-8"))
+                received += 1
+    else:
+        for _ in range(num_children * num_messages):
+            print("Received:", q.get())
 
     # Wait for all child processes to finish
     for p in processes:
         p.join()
 
+    if transport == "ring":
+        q.close()  # Release the shared memory blocks
+
 if __name__ == '__main__':
     #NOTE: Print your name and ID
     print("Hi, this is Rahul Kumar and 20349877")  # Add your name and student ID here
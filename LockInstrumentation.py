@@ -0,0 +1,164 @@
+"""
+This program instruments threading locks and semaphores to show where threads spend their time.
+An instrumented primitive wraps a Lock or Semaphore and records, per thread, how many times it was
+acquired, how long each acquire waited, and how long it was held. Counters are kept in thread-local
+storage, so recording adds no extra lock of its own. The results come out as a summary table and as
+log2 histograms of the wait and hold times.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class ThreadCounts:
+    """Counters of one thread for one primitive (times in seconds)."""
+
+    def __init__(self, thread_name):
+        self.thread_name = thread_name
+        self.acquisitions = 0
+        self.timeouts = 0  # Acquires that gave up (non-blocking or timed out)
+        self.waits = []
+        self.holds = []
+
+
+class InstrumentedLock:
+    """threading.Lock that records wait and hold times. The hold time is recorded by the thread that releases it."""
+
+    def __init__(self, name, primitive=None):
+        self.name = name
+        self._primitive = primitive if primitive is not None else threading.Lock()
+        self._local = threading.local()
+        self.threads = []  # ThreadCounts of every thread that used the primitive
+
+    def _counts(self):
+        counts = getattr(self._local, "counts", None)
+        if counts is None:
+            counts = self._local.counts = ThreadCounts(threading.current_thread().name)
+            self.threads.append(counts)  # list.append is atomic, so no lock is needed
+        return counts
+
+    def acquire(self, *args, **kwargs):
+        start = time.perf_counter()
+        acquired = self._primitive.acquire(*args, **kwargs)
+        now = time.perf_counter()
+        counts = self._counts()
+        counts.waits.append(now - start)
+        if acquired:
+            counts.acquisitions += 1
+            self._acquired(now)
+        else:
+            counts.timeouts += 1
+        return acquired
+
+    def release(self):
+        self._counts().holds.append(time.perf_counter() - self._release_started())
+        self._primitive.release()
+
+    def _acquired(self, now):
+        self._local.acquired_at = now
+
+    def _release_started(self):
+        return self._local.acquired_at
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def reset(self):
+        self.threads = []
+        self._local = threading.local()
+
+    def summary(self):
+        """Totals over all threads: acquisitions, timeouts, mean/max wait and mean hold time."""
+        waits = [w for counts in self.threads for w in counts.waits]
+        holds = [h for counts in self.threads for h in counts.holds]
+        return {
+            "name": self.name,
+            "acquisitions": sum(counts.acquisitions for counts in self.threads),
+            "timeouts": sum(counts.timeouts for counts in self.threads),
+            "total_wait": sum(waits),
+            "mean_wait": sum(waits) / len(waits) if waits else 0,
+            "max_wait": max(waits, default=0),
+            "total_hold": sum(holds),
+            "mean_hold": sum(holds) / len(holds) if holds else 0,
+        }
+
+    def per_thread(self):
+        """One row per thread: acquisitions, total wait and total hold time."""
+        return [{"thread": counts.thread_name, "acquisitions": counts.acquisitions,
+                 "total_wait": sum(counts.waits), "total_hold": sum(counts.holds)} for counts in self.threads]
+
+
+class InstrumentedSemaphore(InstrumentedLock):
+    """
+    threading.Semaphore that records wait and hold times. A semaphore may be released by another thread
+    than the one that acquired it, so releases are matched to acquires in FIFO order: individual hold times
+    are approximate, but their total is exact. Hold times are recorded by the releasing thread.
+    """
+
+    def __init__(self, name, value=1):
+        super().__init__(name, threading.Semaphore(value))
+        self._acquire_times = deque()
+
+    def _acquired(self, now):
+        self._acquire_times.append(now)
+
+    def _release_started(self):
+        return self._acquire_times.popleft()
+
+    def reset(self):
+        super().reset()
+        self._acquire_times.clear()
+
+
+def log_histogram(values):
+    """Count values (seconds) in power-of-two microsecond buckets; returns a list of (upper bound in us, count)."""
+    counts = {}
+    for value in values:
+        bucket = max(0, int(value * 1e6)).bit_length()  # Bucket k holds [2^(k-1), 2^k) microseconds
+        counts[bucket] = counts.get(bucket, 0) + 1
+    if not counts:
+        return []
+    return [(1 << bucket, counts.get(bucket, 0)) for bucket in range(min(counts), max(counts) + 1)]
+
+
+def print_histogram(title, values, width=40):
+    """Display a log2 histogram of times in seconds as text bars."""
+    print(f"\n{title} ({len(values)} samples)")
+    histogram = log_histogram(values)
+    largest = max((count for _, count in histogram), default=0)
+    for upper, count in histogram:
+        bar = "#" * (count * width // largest) if largest else ""
+        print(f"  < {_format_microseconds(upper):>8}: {count:7d} {bar}")
+
+
+def _format_microseconds(us):
+    if us >= 1_000_000:
+        return f"{us / 1_000_000:g} s"
+    if us >= 1000:
+        return f"{us / 1000:g} ms"
+    return f"{us} us"
+
+
+def print_contention_summary(primitives, top_threads=5):
+    """Display the totals of every primitive, the threads that waited longest, and wait/hold histograms."""
+    print("\nPrimitive\tAcquires\tTimeouts\tMean Wait (ms)\tMax Wait (ms)\tMean Hold (ms)")
+    for primitive in primitives:
+        row = primitive.summary()
+        print(f"{row['name']:<12}\t{row['acquisitions']}\t\t{row['timeouts']}\t\t{row['mean_wait'] * 1e3:.3f}"
+              f"\t\t{row['max_wait'] * 1e3:.3f}\t\t{row['mean_hold'] * 1e3:.3f}")
+
+    for primitive in primitives:
+        rows = sorted(primitive.per_thread(), key=lambda r: r["total_wait"], reverse=True)[:top_threads]
+        print(f"\nLongest waits on {primitive.name}:")
+        for row in rows:
+            print(f"  {row['thread']:<20} {row['acquisitions']:6d} acquires, {row['total_wait'] * 1e3:10.3f} ms waiting, "
+                  f"{row['total_hold'] * 1e3:10.3f} ms holding")
+        print_histogram(f"{primitive.name} wait times", [w for c in primitive.threads for w in c.waits])
+        print_histogram(f"{primitive.name} hold times", [h for c in primitive.threads for h in c.holds])
@@ -0,0 +1,166 @@
+"""
+This program implements a batching layer for IPC between child processes and a parent.
+Producers append messages to a bytearray frame as length-prefixed records and send the whole frame when it
+reaches a size limit or has been open for too long, so one pickle (Queue) or one write (Pipe send_bytes)
+carries many messages. The consumer walks the records of a frame as memoryview slices without copying them.
+Messages of one producer stay in order because each producer sends its frames through its own channel in order.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import struct
+import threading
+import time
+from multiprocessing.connection import wait
+
+RECORD_LENGTH = struct.Struct("<I")  # Length prefix of every record in a frame
+MAX_FRAME_BYTES = 64 * 1024  # Flush a frame once it holds this many bytes
+MAX_FRAME_DELAY = 0.05  # Flush a frame once its first message is this many seconds old
+
+
+class BatchWriter:
+    """
+    Accumulates messages into frames and sends each frame as one message on `channel`.
+    The channel is a Connection (send_bytes, the Pipe backend) or anything with put() such as a Queue.
+    A daemon flusher thread sends a frame once its first message is max_delay seconds old, even if no
+    further message is written; close() (or flush()) sends whatever is left.
+    """
+
+    def __init__(self, channel, max_bytes=MAX_FRAME_BYTES, max_delay=MAX_FRAME_DELAY):
+        self.channel = channel
+        self.is_pipe = hasattr(channel, "send_bytes")
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.frame = bytearray()
+        self.opened = 0  # Time the first message of the current frame was written
+        self.frames_sent = 0
+        self.closed = False
+        self._lock = threading.Lock()  # Guards the frame against the flusher thread
+        self._frame_opened = threading.Event()  # Set while a frame is open (and on close) to wake the flusher
+        self._closing = threading.Event()
+        self._flusher = None  # Started on the first write
+
+    def write(self, message):
+        """Append a str or bytes-like message to the current frame, sending the frame if it is full or old."""
+        if isinstance(message, str):
+            message = message.encode()
+        with self._lock:
+            if not self.frame:
+                self.opened = time.monotonic()
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_when_due, name="BatchWriter", daemon=True)
+                    self._flusher.start()
+                self._frame_opened.set()
+            self.frame += RECORD_LENGTH.pack(len(message))
+            self.frame += message
+            if len(self.frame) >= self.max_bytes or time.monotonic() - self.opened >= self.max_delay:
+                self._send()
+
+    def _flush_when_due(self):
+        # Flusher thread: wait for a frame to be opened, then send it once it is max_delay seconds old
+        while not self.closed:
+            self._frame_opened.wait()
+            with self._lock:
+                if not self.frame:
+                    self._frame_opened.clear()
+                    continue
+                remaining = self.opened + self.max_delay - time.monotonic()
+                if remaining <= 0:
+                    self._send()
+                    continue
+            self._closing.wait(remaining)
+
+    def flush(self):
+        """Send the current frame, if it holds any messages."""
+        with self._lock:
+            self._send()
+
+    def _send(self):
+        # The caller holds self._lock
+        if not self.frame:
+            return
+        if self.is_pipe:
+            self.channel.send_bytes(self.frame)
+        else:
+            self.channel.put(bytes(self.frame))  # Queue.put pickles in a feeder thread, so hand it an immutable copy
+        self.frame = bytearray()
+        self.frames_sent += 1
+
+    def close(self):
+        with self._lock:
+            self._send()
+            self.closed = True
+        self._closing.set()
+        self._frame_opened.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        if self.is_pipe:
+            self.channel.close()  # The reader sees EOF once every message has been sent
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_frame(frame):
+    """Yield the records of a frame as memoryview slices of the frame (no copies)."""
+    view = memoryview(frame)
+    offset = 0
+    end = len(view)
+    while offset < end:
+        length = RECORD_LENGTH.unpack_from(view, offset)[0]
+        offset += RECORD_LENGTH.size
+        yield view[offset:offset + length]
+        offset += length
+
+
+def recv_frames(readers):
+    """
+    Yield (reader, frame) for every frame received on a list of Pipe read ends, until every writer has closed.
+    Frames of one reader are yielded in the order they were sent.
+    """
+    readers = list(readers)
+    while readers:
+        for reader in wait(readers):
+            try:
+                frame = reader.recv_bytes()
+            except EOFError:
+                readers.remove(reader)
+                reader.close()
+                continue
+            yield reader, frame
+
+
+def produce_messages(channel, process_number, num_messages):
+    """Child process: send num_messages numbered messages through a BatchWriter."""
+    with BatchWriter(channel) as writer:
+        for i in range(num_messages):
+            writer.write(f"Message {i+1} from child process {process_number}")
+
+
+if __name__ == '__main__':
+    from multiprocessing import Pipe, Process
+
+    num_children, num_messages = 4, 100000
+    readers, processes = [], []
+    start = time.perf_counter()
+    for i in range(num_children):
+        reader, writer = Pipe(duplex=False)
+        p = Process(target=produce_messages, args=(writer, i+1, num_messages))
+        p.start()
+        writer.close()  # Only the child keeps the write end open
+        readers.append(reader)
+        processes.append(p)
+
+    received = frames = 0
+    for _, frame in recv_frames(readers):
+        frames += 1
+        for record in iter_frame(frame):
+            received += 1
+    for p in processes:
+        p.join()
+
+    elapsed = time.perf_counter() - start
+    print(f"Received {received} messages in {frames} frames in {elapsed:.2f} s ({received / elapsed:.0f} messages/s)")
@@ -0,0 +1,146 @@
+"""
+This program simulates Round Robin scheduling on N CPU cores with per-core run queues and work stealing.
+It runs as a heap-driven discrete-event simulation: only slice ends and arrivals are processed, so large
+workloads cost O(total slices x cores) instead of stepping through every unit of time (each event checks every
+core for idleness and a steal scans every run queue for the longest one).
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+
+from RoundRobinEngine import RoundRobinResult, unpack_processes
+
+
+@dataclass
+class MultiCoreResult(RoundRobinResult):
+    """RoundRobinResult extended with per-core statistics."""
+    core_busy_times: list = field(default_factory=list)
+    core_context_switches: list = field(default_factory=list)
+    makespan: int = 0
+    migrations: int = 0  # Number of processes moved to another core by work stealing
+
+    @property
+    def core_utilization(self):
+        return [busy / self.makespan if self.makespan else 0 for busy in self.core_busy_times]
+
+
+def build_result(process_ids, burst_times, arrival_times, completion_time, response_time,
+                 core_busy_times, core_context_switches, migrations=0):
+    """Assemble a MultiCoreResult from the raw per-process and per-core counters."""
+    n = len(process_ids)
+    turnaround_time = [completion_time[i] - arrival_times[i] for i in range(n)]
+    waiting_time = [turnaround_time[i] - burst_times[i] for i in range(n)]
+    return MultiCoreResult(process_ids, burst_times, arrival_times, completion_time, waiting_time,
+                           turnaround_time, response_time, sum(core_context_switches),
+                           core_busy_times, core_context_switches, max(completion_time, default=0), migrations)
+
+
+def simulate_multicore(processes, quantum, num_cores=2, work_stealing=True):
+    """
+    Simulate Round Robin scheduling on `num_cores` cores, each with its own run queue.
+    Arriving processes are placed on the cores in turn; a preempted process goes back to the tail of
+    its own core's queue. When a core runs out of work it steals half of the longest queue.
+    Context switches are counted once per time slice on each core.
+    """
+    if quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+    if num_cores <= 0:
+        raise ValueError("Number of cores must be a positive integer")
+
+    process_ids, burst_times, arrival_times = unpack_processes(processes)
+    n = len(processes)
+    rem_burst_times = list(burst_times)
+    completion_time = [0] * n
+    response_time = [-1] * n
+
+    pending = [(arrival_times[i], i) for i in range(n)]  # Arrival-ordered heap
+    heapq.heapify(pending)
+    run_queues = [deque() for _ in range(num_cores)]
+    running = [None] * num_cores  # Process index running on each core
+    slice_ends = []  # Heap of (end time, core) for the slices in progress
+    core_busy_times = [0] * num_cores
+    core_context_switches = [0] * num_cores
+    next_core = 0  # Core that receives the next arriving process
+    queued = 0  # Total number of processes waiting in the run queues
+    migrations = 0
+    completed = 0
+    t = 0
+
+    while completed < n:
+        # Advance to the next event: a slice end or an arrival
+        t = min(slice_ends[0][0] if slice_ends else float('inf'), pending[0][0] if pending else float('inf'))
+
+        # Arrivals at time t are queued ahead of the processes preempted at time t
+        while pending and pending[0][0] <= t:
+            i = heapq.heappop(pending)[1]
+            if rem_burst_times[i] > 0:
+                run_queues[next_core].append(i)
+                next_core = (next_core + 1) % num_cores
+                queued += 1
+            else:
+                completion_time[i] = arrival_times[i]
+                response_time[i] = 0
+                completed += 1
+
+        while slice_ends and slice_ends[0][0] <= t:
+            core = heapq.heappop(slice_ends)[1]
+            i = running[core]
+            running[core] = None
+            if rem_burst_times[i] == 0:
+                completion_time[i] = t
+                completed += 1
+            else:
+                run_queues[core].append(i)
+                queued += 1
+
+        # Dispatch every idle core
+        for core in range(num_cores):
+            if not queued:
+                break
+            if running[core] is not None:
+                continue
+            queue = run_queues[core]
+            if not queue and work_stealing:
+                victim = max(range(num_cores), key=lambda c: len(run_queues[c]))
+                stolen = len(run_queues[victim]) // 2 or len(run_queues[victim])
+                for _ in range(stolen):
+                    queue.appendleft(run_queues[victim].pop())
+                migrations += stolen
+            if not queue:
+                continue
+
+            i = queue.popleft()
+            queued -= 1
+            if response_time[i] < 0:
+                response_time[i] = t - arrival_times[i]
+            run = min(rem_burst_times[i], quantum)
+            rem_burst_times[i] -= run
+            running[core] = i
+            core_busy_times[core] += run
+            core_context_switches[core] += 1
+            heapq.heappush(slice_ends, (t + run, core))
+
+    return build_result(process_ids, burst_times, arrival_times, completion_time, response_time,
+                        core_busy_times, core_context_switches, migrations)
+
+
+def print_core_statistics(result):
+    """Display per-core utilization and context switches."""
+    print("\nCore\tBusy Time\tUtilization\tContext Switches")
+    for core in range(len(result.core_busy_times)):
+        print(f"{core}\t{result.core_busy_times[core]}\t\t{result.core_utilization[core] * 100:.2f}%\t\t{result.core_context_switches[core]}")
+    print(f"\nMakespan: {result.makespan}")
+    print(f"Average Waiting Time: {result.avg_waiting}")
+    print(f"Average Turnaround Time: {result.avg_turnaround}")
+    print(f"Number of context switches: {result.context_switches}")
+    if result.migrations:
+        print(f"Number of migrations: {result.migrations}")
+
+
+if __name__ == '__main__':
+    # Sample list of processes [process_id, burst_time, arrival_time]
+    processes = [[1, 10, 0], [2, 1, 1], [3, 2, 2], [4, 1, 3], [5, 5, 4], [6, 8, 4], [7, 3, 6]]
+    print_core_statistics(simulate_multicore(processes, quantum=2, num_cores=2))
@@ -0,0 +1,131 @@
+"""
+This program simulates a Multi-Level Feedback Queue (MLFQ) scheduler built on Round Robin.
+Each level is a Round Robin queue with its own time quantum (growing at lower priorities). A process that
+uses its whole quantum is demoted one level, and every `boost_interval` time units all processes are moved
+back to the top level so long jobs do not starve. Several cores can share the queues.
+It runs as a heap-driven discrete-event simulation, so only arrivals and slice ends are processed.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import heapq
+from collections import deque
+
+from MultiCoreScheduling import build_result, print_core_statistics
+from RoundRobinEngine import unpack_processes
+
+
+def simulate_mlfq(processes, quanta=(2, 4, 8), boost_interval=100, num_cores=1):
+    """
+    Simulate MLFQ scheduling and return a MultiCoreResult.
+    `quanta` gives the time quantum of each level, from highest to lowest priority. Idle cores pick the
+    first process of the highest non-empty level; priorities are re-checked at every quantum boundary.
+    Context switches are counted once per time slice on each core.
+    """
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError("Every level needs a positive time quantum")
+    if boost_interval <= 0:
+        raise ValueError("Boost interval must be a positive integer")
+    if num_cores <= 0:
+        raise ValueError("Number of cores must be a positive integer")
+
+    process_ids, burst_times, arrival_times = unpack_processes(processes)
+    n = len(processes)
+    num_levels = len(quanta)
+    rem_burst_times = list(burst_times)
+    completion_time = [0] * n
+    response_time = [-1] * n
+    level = [0] * n  # Priority level of each process, valid only while its epoch is current
+    epoch = [0] * n  # Boost epoch in which level[i] was last set
+
+    pending = [(arrival_times[i], i) for i in range(n)]  # Arrival-ordered heap
+    heapq.heapify(pending)
+    # Round Robin queues of levels 1 and below. The top level is a chain of queues: a boost appends the
+    # lower queues to the chain in O(levels) instead of moving every waiting process
+    top = deque([deque()])
+    levels = [top[-1]] + [deque() for _ in range(num_levels - 1)]  # levels[0] is the last queue of the chain
+    running = [None] * num_cores  # Process index running on each core
+    used_full_quantum = [False] * num_cores  # Whether the current slice on each core used its whole quantum
+    slice_ends = []  # Heap of (end time, core) for the slices in progress
+    idle_cores = list(range(num_cores))  # Heap of idle core ids, lowest id is dispatched first
+    core_busy_times = [0] * num_cores
+    core_context_switches = [0] * num_cores
+    boost_epoch = 0  # Number of boosts so far; a process with an older epoch is back at level 0
+    next_boost = boost_interval
+    completed = 0
+    t = 0
+
+    while completed < n:
+        # Advance to the next event: a slice end or an arrival
+        t = min(slice_ends[0][0] if slice_ends else float('inf'), pending[0][0] if pending else float('inf'))
+
+        if t >= next_boost:
+            # Priority boost: nothing is dispatched between events, so applying it lazily is equivalent
+            for k in range(1, num_levels):
+                if levels[k]:
+                    top.append(levels[k])
+                    levels[k] = deque()
+            if top[-1] is not levels[0]:
+                top.append(deque())  # New level 0 processes queue behind the boosted ones
+            levels[0] = top[-1]
+            boost_epoch += 1
+            next_boost = (t // boost_interval + 1) * boost_interval
+
+        # Arrivals at time t are queued ahead of the processes preempted at time t
+        while pending and pending[0][0] <= t:
+            i = heapq.heappop(pending)[1]
+            if rem_burst_times[i] > 0:
+                level[i], epoch[i] = 0, boost_epoch
+                levels[0].append(i)
+            else:
+                completion_time[i] = arrival_times[i]
+                response_time[i] = 0
+                completed += 1
+
+        while slice_ends and slice_ends[0][0] <= t:
+            core = heapq.heappop(slice_ends)[1]
+            i = running[core]
+            running[core] = None
+            heapq.heappush(idle_cores, core)
+            if rem_burst_times[i] == 0:
+                completion_time[i] = t
+                completed += 1
+            else:
+                if epoch[i] != boost_epoch:
+                    # The slice started before a boost, so it must not demote the process again
+                    level[i], epoch[i] = 0, boost_epoch
+                elif used_full_quantum[core]:
+                    # The whole quantum was used, so the process is demoted one level
+                    level[i] = min(level[i] + 1, num_levels - 1)
+                levels[level[i]].append(i)
+
+        # Dispatch idle cores from the highest non-empty level
+        while idle_cores:
+            while len(top) > 1 and not top[0]:
+                top.popleft()
+            queue = top[0] if top[0] else next((q for q in levels[1:] if q), None)
+            if queue is None:
+                break
+            core = heapq.heappop(idle_cores)
+            i = queue.popleft()
+            if epoch[i] != boost_epoch:
+                level[i], epoch[i] = 0, boost_epoch
+            if response_time[i] < 0:
+                response_time[i] = t - arrival_times[i]
+            quantum = quanta[level[i]]
+            run = min(rem_burst_times[i], quantum)
+            rem_burst_times[i] -= run
+            used_full_quantum[core] = run == quantum
+            running[core] = i
+            core_busy_times[core] += run
+            core_context_switches[core] += 1
+            heapq.heappush(slice_ends, (t + run, core))
+
+    return build_result(process_ids, burst_times, arrival_times, completion_time, response_time,
+                        core_busy_times, core_context_switches)
+
+
+if __name__ == '__main__':
+    # Sample list of processes [process_id, burst_time, arrival_time]
+    processes = [[1, 30, 0], [2, 1, 1], [3, 2, 2], [4, 1, 3], [5, 12, 4], [6, 8, 4], [7, 3, 6]]
+    print_core_statistics(simulate_mlfq(processes, quanta=(2, 4, 8), boost_interval=20, num_cores=2))
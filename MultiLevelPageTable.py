@@ -0,0 +1,140 @@
+"""
+This program implements a multi-level page table with a configurable address geometry.
+The number of levels and the bits per level are arbitrary (for example 9+9+9+9 bits with a 12-bit offset
+for 48-bit addresses and 4 KiB pages). Lower-level tables are allocated lazily as compact array('I') blocks
+whose entries carry a present bit, and the memory footprint can be compared against a fully populated layout.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import random
+from array import array
+
+from TwoLevelPageTableTLBSimulation import LEVEL_1_BITS, LEVEL_2_BITS, OFFSET_BITS, page_table
+
+PRESENT_BIT = 1  # Bit 0 of every entry; the remaining 31 bits hold a frame number or a table number
+
+
+class MultiLevelPageTable:
+    """
+    Page table with len(level_bits) levels. Entry values are (payload << 1) | PRESENT_BIT, where the payload
+    is the number of the next-level table for inner levels and the physical frame for the last level.
+    """
+
+    def __init__(self, level_bits=(LEVEL_1_BITS, LEVEL_2_BITS), offset_bits=OFFSET_BITS):
+        if not level_bits or any(bits <= 0 for bits in level_bits) or offset_bits < 0:
+            raise ValueError("Every level needs at least one bit and the offset cannot be negative")
+        self.level_bits = tuple(level_bits)
+        self.offset_bits = offset_bits
+        self.address_bits = sum(self.level_bits) + offset_bits
+        self.tables = []  # Every allocated table; tables[0] is the root
+        self.mapped_pages = 0
+        self._new_table(0)
+
+    def _new_table(self, level):
+        # Zero-filled block of entries: nothing is present yet
+        self.tables.append(array('I', bytes(4 << self.level_bits[level])))
+        return len(self.tables) - 1
+
+    def split(self, virtual_address):
+        """Split a virtual address into its per-level indices and the page offset."""
+        indices = []
+        shift = self.address_bits
+        for bits in self.level_bits:
+            shift -= bits
+            indices.append((virtual_address >> shift) & ((1 << bits) - 1))
+        return indices, virtual_address & ((1 << self.offset_bits) - 1)
+
+    def map(self, virtual_address, frame):
+        """Map the page holding virtual_address to a physical frame, allocating tables on the way."""
+        if not 0 <= frame < 1 << 31:
+            raise ValueError("Frame numbers must fit in 31 bits")
+        indices, _ = self.split(virtual_address)
+        table = self.tables[0]
+        for level, index in enumerate(indices[:-1]):
+            entry = table[index]
+            if not entry & PRESENT_BIT:
+                entry = (self._new_table(level + 1) << 1) | PRESENT_BIT
+                table[index] = entry
+            table = self.tables[entry >> 1]
+
+        if not table[indices[-1]] & PRESENT_BIT:
+            self.mapped_pages += 1
+        table[indices[-1]] = (frame << 1) | PRESENT_BIT
+
+    def unmap(self, virtual_address):
+        """Clear the present bit of a page. Returns True if the page was mapped."""
+        table, index = self._walk(virtual_address)
+        if table is None or not table[index] & PRESENT_BIT:
+            return False
+        table[index] = 0
+        self.mapped_pages -= 1
+        return True
+
+    def _walk(self, virtual_address):
+        # Return the last-level table and index for an address, or (None, None) if a table is missing
+        indices, _ = self.split(virtual_address)
+        table = self.tables[0]
+        for index in indices[:-1]:
+            entry = table[index]
+            if not entry & PRESENT_BIT:
+                return None, None
+            table = self.tables[entry >> 1]
+        return table, indices[-1]
+
+    def lookup(self, virtual_address):
+        """Return the physical frame of the page holding virtual_address, or None on a page fault."""
+        table, index = self._walk(virtual_address)
+        if table is None or not table[index] & PRESENT_BIT:
+            return None
+        return table[index] >> 1
+
+    def translate(self, virtual_address):
+        """Return the physical address for virtual_address, or None on a page fault."""
+        frame = self.lookup(virtual_address)
+        if frame is None:
+            return None
+        return (frame << self.offset_bits) | (virtual_address & ((1 << self.offset_bits) - 1))
+
+    def memory_footprint(self):
+        """Bytes used by the allocated tables."""
+        return sum(table.itemsize * len(table) for table in self.tables)
+
+    def dense_footprint(self):
+        """Bytes a fully populated table tree with the same geometry would use."""
+        total = 0
+        tables_at_level = 1
+        for bits in self.level_bits:
+            total += tables_at_level * (4 << bits)
+            tables_at_level <<= bits
+        return total
+
+
+def from_two_level_page_table(two_level_page_table):
+    """Build a MultiLevelPageTable with the simulator's geometry from its dict-of-dicts page table."""
+    table = MultiLevelPageTable((LEVEL_1_BITS, LEVEL_2_BITS), OFFSET_BITS)
+    for level_1_index, level_2_table in two_level_page_table.items():
+        for level_2_index, frame in level_2_table.items():
+            virtual_address = ((level_1_index << LEVEL_2_BITS) | level_2_index) << OFFSET_BITS
+            table.map(virtual_address, frame)
+    return table
+
+
+def print_footprint(name, table):
+    """Display the sparse vs dense memory footprint of a page table."""
+    print(f"\n{name}")
+    print(f"Levels: {len(table.level_bits)} ({'+'.join(map(str, table.level_bits))} bits, {table.offset_bits}-bit offset)")
+    print(f"Mapped Pages: {table.mapped_pages}")
+    print(f"Allocated Tables: {len(table.tables)}")
+    print(f"Sparse Footprint: {table.memory_footprint()} bytes")
+    print(f"Dense Footprint: {table.dense_footprint()} bytes")
+
+
+if __name__ == '__main__':
+    print_footprint("Simulator Page Table", from_two_level_page_table(page_table))
+
+    # 48-bit virtual addresses with 4 KiB pages and a 4-level table
+    table = MultiLevelPageTable((9, 9, 9, 9), 12)
+    for frame in range(10000):
+        table.map(random.getrandbits(48), frame)
+    print_footprint("48-bit Address Space, 10000 Random Pages", table)
@@ -4,11 +4,13 @@ Author: Rahul Kumar
 Date: September 20, 2024
 """
 
+import argparse
 import multiprocessing
 import os
 import time
 import random  # For simulating dynamic I/O delays
-import psutil  # For measuring CPU usage
+
+from ProcessSampler import ProcessSampler, print_sampler_summary  # For per-process CPU, memory and I/O sampling
 
 # A function to simulate I/O-bound task with a system call (simulates waiting for I/O)
 def io_bound_system_call_worker(name):
@@ -58,13 +60,17 @@ def cpu_bound_task(name):
     print(f"Process {name} with PID {os.getpid()} has finished CPU-bound task with result {result}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run I/O-bound and CPU-bound processes and sample their resource usage.")
+    parser.add_argument("--trace", metavar="PATH", help="write a Chrome-trace timeline of the tasks to PATH")
+    args = parser.parse_args()
 
     start_time = time.time()  # Start the timer
 
-    # Question 3: Measure CPU utilization before running tasks
-    # Original code did not measure CPU usage here
-    # Added to measure initial CPU utilization
-    initial_cpu = psutil.cpu_percent(interval=1)  # Capture initial CPU usage
+    # Question 3: Measure CPU utilization while the tasks run
+    # Previously: initial_cpu = psutil.cpu_percent(interval=1), which added 1 s of dead time before and after
+    # A background sampler records CPU%, RSS, context switches and I/O of every child every 0.1 s instead
+    sampler = ProcessSampler(interval=0.1)
+    sampler.start()
 
     # Create a list to hold the process objects
     processes = []
@@ -80,6 +86,7 @@ if __name__ == "__main__":
 
         # 11- Start the I/O-bound process
         process.start()
+        sampler.add(process.pid, f'IO-Worker-{i}', "io")
 
     # Create CPU-bound processes (simulating CPU work)
     # Original code: for i in range(2)  # Let's create 2 CPU-bound processes
@@ -94,15 +101,14 @@ if __name__ == "__main__":
 
         # 14- Start the CPU-bound process
         process.start()
+        sampler.add(process.pid, f'CPU-Worker-{i}', "cpu")
 
     # Wait for all processes to finish
     for process in processes:
         process.join()  # Ensure the main program waits for all processes to complete
 
-    # Question 3: Measure CPU utilization after tasks complete
-    # Original code did not measure CPU usage here
-    # Added to measure final CPU utilization
-    final_cpu = psutil.cpu_percent(interval=1)  # Capture final CPU usage
+    # Question 3: Stop sampling once the tasks complete
+    sampler.stop()
 
     # TODO-6
     # 15- Record the end-time of execution
@@ -111,8 +117,9 @@ if __name__ == "__main__":
     # 16- Print "All processes finished. Total execution time: {execution_time} seconds"
     print(f"All processes finished. Total execution time: {end_time - start_time} seconds")
 
-    # Question 3: Print CPU utilization before and after
-    # Original code did not print CPU usage changes
-    # Added to display CPU utilization results
-    print(f"Initial CPU usage: {initial_cpu}%")
-    print(f"Final CPU usage: {final_cpu}%")
+    # Question 3: Print the per-task resource usage and core utilization
+    print_sampler_summary(sampler)
+    if args.trace:
+        # The timeline can be opened in chrome://tracing or https://ui.perfetto.dev
+        sampler.export_chrome_trace(args.trace)
+        print(f"Timeline written to {args.trace}")
@@ -0,0 +1,189 @@
+"""
+This program samples the resource usage of worker processes in the background while they run.
+Every `interval` seconds a sampler thread records, for each tracked PID, its CPU%, resident memory (RSS),
+voluntary and involuntary context switches and I/O byte counters, plus the utilization of every core.
+Each task's start and end time is recorded too, and everything can be exported as a Chrome trace
+(open it in chrome://tracing or https://ui.perfetto.dev) to see how CPU-bound and I/O-bound work overlap.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import json
+import threading
+import time
+
+import psutil  # For per-process CPU, memory, context switch and I/O counters
+
+
+class ProcessSampler:
+    """
+    Background sampler for a set of processes. Call add() right after starting each process; a process's
+    task ends when it exits (detected at the next sample, so the end time has a resolution of `interval`).
+    Tasks that report their own timestamps can be added with record_task().
+    """
+
+    def __init__(self, interval=0.1):
+        if interval <= 0:
+            raise ValueError("The sampling interval must be positive")
+        self.interval = interval
+        self.samples = []  # One dict per (sample time, PID)
+        self.core_samples = []  # (sample time, list of per-core CPU%)
+        self.tasks = []  # Dicts with name, kind, pid, tid, start and end (time.time() seconds)
+        self.start_time = None
+        self._tracked = {}  # PID -> (psutil.Process, task dict)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ProcessSampler", daemon=True)
+
+    def start(self):
+        self.start_time = time.time()
+        psutil.cpu_percent(percpu=True)  # The first call only sets the baseline
+        self._thread.start()
+
+    def add(self, pid, name, kind=""):
+        """Start tracking a running process as the task `name`."""
+        task = {"name": name, "kind": kind, "pid": pid, "tid": pid, "start": time.time(), "end": None}
+        try:
+            process = psutil.Process(pid)
+            process.cpu_percent(None)
+        except psutil.NoSuchProcess:
+            task["end"] = task["start"]  # Already gone
+            process = None
+        with self._lock:
+            self.tasks.append(task)
+            if process is not None:
+                self._tracked[pid] = (process, task)
+
+    def record_task(self, name, kind, pid, start, end, tid=None):
+        """Add a task that measured its own start and end times (time.time() seconds)."""
+        with self._lock:
+            self.tasks.append({"name": name, "kind": kind, "pid": pid, "tid": pid if tid is None else tid,
+                               "start": start, "end": end})
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Take one sample of every tracked process and of the cores."""
+        now = time.time()
+        self.core_samples.append((now, psutil.cpu_percent(percpu=True)))
+        with self._lock:
+            tracked = list(self._tracked.items())
+
+        for pid, (process, task) in tracked:
+            try:
+                with process.oneshot():
+                    if process.status() == psutil.STATUS_ZOMBIE:
+                        raise psutil.NoSuchProcess(pid)
+                    cpu_percent = process.cpu_percent(None)
+                    rss = process.memory_info().rss
+                    ctx_switches = process.num_ctx_switches()
+                    io = _io_counters(process)
+            except psutil.NoSuchProcess:
+                # The process has exited (or is waiting to be joined): its task is over
+                task["end"] = now
+                with self._lock:
+                    del self._tracked[pid]
+                continue
+            self.samples.append({
+                "time": now,
+                "pid": pid,
+                "cpu_percent": cpu_percent,
+                "rss": rss,
+                "voluntary_ctx_switches": ctx_switches.voluntary,
+                "involuntary_ctx_switches": ctx_switches.involuntary,
+                "read_bytes": io.read_bytes if io else None,
+                "write_bytes": io.write_bytes if io else None,
+            })
+
+    def stop(self):
+        """Stop sampling; tasks still running are ended at the stop time."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.sample()
+        now = time.time()
+        with self._lock:
+            for _, task in self._tracked.values():
+                task["end"] = now
+            self._tracked.clear()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def task_summary(self):
+        """Per task: duration, mean CPU%, peak RSS, and the last context switch and I/O counters seen."""
+        by_pid = {}
+        for sample in self.samples:
+            by_pid.setdefault(sample["pid"], []).append(sample)
+        summary = []
+        for task in self.tasks:
+            samples = by_pid.get(task["pid"], [])
+            last = samples[-1] if samples else {}
+            summary.append({
+                "name": task["name"],
+                "kind": task["kind"],
+                "pid": task["pid"],
+                "duration": task["end"] - task["start"],
+                "mean_cpu_percent": sum(s["cpu_percent"] for s in samples) / len(samples) if samples else 0,
+                "peak_rss": max((s["rss"] for s in samples), default=0),
+                "voluntary_ctx_switches": last.get("voluntary_ctx_switches", 0),
+                "involuntary_ctx_switches": last.get("involuntary_ctx_switches", 0),
+                "read_bytes": last.get("read_bytes"),
+                "write_bytes": last.get("write_bytes"),
+            })
+        return summary
+
+    def chrome_trace(self):
+        """Return the tasks and samples as a Chrome trace event dictionary (timestamps in microseconds)."""
+        origin = self.start_time or 0
+
+        def ts(t):
+            return round((t - origin) * 1e6)
+
+        events = []
+        for task in self.tasks:
+            events.append({"name": "process_name", "ph": "M", "pid": task["pid"], "args": {"name": task["name"]}})
+            events.append({"name": task["name"], "cat": task["kind"], "ph": "X", "pid": task["pid"],
+                           "tid": task["tid"], "ts": ts(task["start"]), "dur": ts(task["end"]) - ts(task["start"])})
+        for sample in self.samples:
+            events.append({"name": "CPU %", "ph": "C", "pid": sample["pid"], "ts": ts(sample["time"]),
+                           "args": {"cpu": sample["cpu_percent"]}})
+            events.append({"name": "RSS (MB)", "ph": "C", "pid": sample["pid"], "ts": ts(sample["time"]),
+                           "args": {"rss": round(sample["rss"] / 2 ** 20, 2)}})
+        # The per-core utilization goes in its own row, under PID 0
+        events.append({"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "Cores"}})
+        for sample_time, cores in self.core_samples:
+            events.append({"name": "Core CPU %", "ph": "C", "pid": 0, "ts": ts(sample_time),
+                           "args": {f"core{i}": percent for i, percent in enumerate(cores)}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file)
+
+
+def _io_counters(process):
+    # Per-process I/O counters are not available on every platform (e.g. macOS)
+    try:
+        return process.io_counters()
+    except (AttributeError, psutil.AccessDenied):
+        return None
+
+
+def print_sampler_summary(sampler):
+    """Display the per-task summary and the average utilization of every core."""
+    print("Task\t\tKind\tPID\tDuration (s)\tMean CPU%\tPeak RSS (MB)\tCtx Switches (vol/invol)")
+    for row in sampler.task_summary():
+        print(f"{row['name']:<15}\t{row['kind']}\t{row['pid']}\t{row['duration']:.2f}\t\t{row['mean_cpu_percent']:.1f}"
+              f"\t\t{row['peak_rss'] / 2 ** 20:.1f}\t\t{row['voluntary_ctx_switches']}/{row['involuntary_ctx_switches']}")
+    if sampler.core_samples:
+        num_cores = len(sampler.core_samples[0][1])
+        averages = [sum(cores[i] for _, cores in sampler.core_samples) / len(sampler.core_samples)
+                    for i in range(num_cores)]
+        print("Average core utilization: " + ", ".join(f"core{i} {avg:.1f}%" for i, avg in enumerate(averages)))
@@ -0,0 +1,96 @@
+"""
+This program computes Round Robin scheduling metrics for many independent workloads at once using NumPy.
+Every process arrives at t=0. A process with burst b finishes in round r = ceil(b / quantum), and by then
+every process j ahead of it (j <= i) has run min(b_j, r * quantum) while every process behind it has run
+min(b_j, (r - 1) * quantum), so completion times follow from array operations instead of a Python loop.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import contextlib
+import io
+
+import numpy as np  # For vectorized array operations
+
+from RoundRobinScheduling import round_robin_scheduling
+
+MAX_CHUNK_ELEMENTS = 1 << 22  # Upper bound on the (workloads x processes x processes) block built at once
+
+
+def batch_round_robin(burst_times, quanta):
+    """
+    Compute Round Robin metrics for a 2-D array of burst times (workloads x processes).
+    `quanta` is a scalar or a vector with one time quantum per workload. Workloads with fewer
+    processes can be padded with zero bursts, which do not affect the other processes.
+    Returns (waiting_time, turnaround_time, context_switches) where the first two have the same
+    shape as `burst_times` and context_switches has one entry per workload.
+    """
+    bursts = np.asarray(burst_times, dtype=np.int64)
+    if bursts.ndim != 2:
+        raise ValueError("burst_times must be a 2-D array (workloads x processes)")
+    num_workloads, n = bursts.shape
+    quanta = np.broadcast_to(np.asarray(quanta, dtype=np.int64), (num_workloads,))
+    if np.any(quanta <= 0):
+        raise ValueError("Time quantum must be a positive integer")
+
+    rounds = -(-bursts // quanta[:, None])  # Round in which each process finishes
+    completion_time = np.zeros_like(bursts)
+
+    # j <= i: runs ahead of (or is) process i in every round up to and including round r_i
+    ahead = np.tril(np.ones((n, n), dtype=bool))
+    chunk = max(1, MAX_CHUNK_ELEMENTS // max(n * n, 1))
+
+    for start in range(0, num_workloads, chunk):
+        b = bursts[start:start + chunk]
+        q = quanta[start:start + chunk, None, None]
+        r = rounds[start:start + chunk, :, None]
+        # Work done by process j (last axis) by the time process i (middle axis) finishes
+        limit = np.where(ahead, r * q, (r - 1) * q)
+        completion_time[start:start + chunk] = np.minimum(b[:, None, :], limit).sum(axis=2)
+
+    # Processes with no burst never run and complete at t=0
+    completion_time[bursts <= 0] = 0
+
+    turnaround_time = completion_time
+    waiting_time = turnaround_time - bursts
+    context_switches = np.where(bursts > 0, rounds, 0).sum(axis=1)
+    return waiting_time, turnaround_time, context_switches
+
+
+def scalar_round_robin(processes, quantum):
+    """
+    Run the original round_robin_scheduling with its display suppressed.
+    Returns (waiting times, turnaround times, number of executed slices).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return round_robin_scheduling(processes, quantum)
+
+
+def check_against_scalar(burst_times, quanta):
+    """Verify batch_round_robin against the scalar round_robin_scheduling, one workload at a time."""
+    bursts = np.asarray(burst_times, dtype=np.int64)
+    quanta = np.broadcast_to(np.asarray(quanta, dtype=np.int64), (bursts.shape[0],))
+    waiting_time, turnaround_time, context_switches = batch_round_robin(bursts, quanta)
+
+    for w in range(bursts.shape[0]):
+        processes = [[i + 1, int(b)] for i, b in enumerate(bursts[w])]
+        scalar_waiting, scalar_turnaround, slices = scalar_round_robin(processes, int(quanta[w]))
+        if (scalar_waiting != waiting_time[w].tolist()
+                or scalar_turnaround != turnaround_time[w].tolist()
+                or slices != context_switches[w]):
+            return False
+    return True
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(2024)
+    num_workloads, num_processes = 10000, 5
+    bursts = rng.integers(1, 11, size=(num_workloads, num_processes))
+    quanta = rng.integers(1, 6, size=num_workloads)
+
+    waiting_time, turnaround_time, context_switches = batch_round_robin(bursts, quanta)
+    print(f"Workloads: {num_workloads} x {num_processes} processes")
+    print(f"Mean Average Waiting Time: {waiting_time.mean():.3f}")
+    print(f"Mean Average Turnaround Time: {turnaround_time.mean():.3f}")
+    print(f"Mean Context Switches: {context_switches.mean():.3f}")
+    print(f"Matches scalar results: {check_against_scalar(bursts[:200], quanta[:200])}")
@@ -0,0 +1,217 @@
+"""
+This program implements an event-driven Round Robin scheduling engine with arrival times.
+Instead of rescanning every process on every pass, it keeps a real ready queue (a deque) fed by
+an arrival-ordered heap, so the cost grows with the number of time slices rather than passes x processes.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from itertools import groupby
+
+
+@dataclass
+class RoundRobinResult:
+    """Per-process scheduling results, stored in the same order as the input processes."""
+    process_ids: list
+    burst_times: list
+    arrival_times: list
+    completion_times: list
+    waiting_times: list
+    turnaround_times: list
+    response_times: list
+    context_switches: int = 0
+
+    @property
+    def avg_waiting(self):
+        return sum(self.waiting_times) / len(self.waiting_times) if self.waiting_times else 0
+
+    @property
+    def avg_turnaround(self):
+        return sum(self.turnaround_times) / len(self.turnaround_times) if self.turnaround_times else 0
+
+    @property
+    def avg_response(self):
+        return sum(self.response_times) / len(self.response_times) if self.response_times else 0
+
+
+def unpack_processes(processes):
+    """
+    Split a list of [process_id, burst_time] or [process_id, burst_time, arrival_time] entries
+    into separate lists. Processes without an arrival time arrive at t=0.
+    """
+    process_ids = [p[0] for p in processes]
+    burst_times = [p[1] for p in processes]
+    arrival_times = [p[2] if len(p) > 2 else 0 for p in processes]
+    return process_ids, burst_times, arrival_times
+
+
+def simulate_round_robin(processes, quantum):
+    """
+    Simulate Round Robin scheduling with arrival times and return a RoundRobinResult.
+    A process whose quantum expires is re-queued behind every process that arrived by that time.
+    Context switches are counted once per time slice, the same way as RoundRobinSchedulingVersion2.py.
+    """
+    if quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+
+    process_ids, burst_times, arrival_times = unpack_processes(processes)
+    n = len(processes)
+    rem_burst_times = list(burst_times)  # Remaining burst times for each process
+    completion_time = [0] * n  # Completion times for each process
+    response_time = [-1] * n  # Time from arrival to first dispatch (-1 until dispatched)
+
+    # Processes that have not arrived yet, ordered by (arrival time, input order)
+    pending = [(arrival_times[i], i) for i in range(n)]
+    heapq.heapify(pending)
+    ready = deque()  # Ready queue of process indices
+    t = 0  # Current time
+    context_switches = 0
+    completed = 0
+
+    def admit_arrivals():
+        # Move every process that has arrived by the current time into the ready queue
+        nonlocal completed
+        while pending and pending[0][0] <= t:
+            i = heapq.heappop(pending)[1]
+            if rem_burst_times[i] > 0:
+                ready.append(i)
+            else:
+                # Nothing to run, the process completes as soon as it arrives
+                completion_time[i] = arrival_times[i]
+                response_time[i] = 0
+                completed += 1
+
+    while completed < n:
+        admit_arrivals()
+        if not ready:
+            # CPU is idle, jump straight to the next arrival (if any process is still to come)
+            if pending:
+                t = pending[0][0]
+            continue
+
+        i = ready.popleft()
+        if response_time[i] < 0:
+            response_time[i] = t - arrival_times[i]
+
+        if ready:
+            # Other processes are waiting, so run a single quantum
+            slices = 1
+            run = min(rem_burst_times[i], quantum)
+        else:
+            # Only this job is runnable: skip ahead to the first quantum boundary at or after the
+            # next arrival, or straight to completion if nothing arrives before it finishes
+            slices = -(-rem_burst_times[i] // quantum)
+            if pending:
+                slices = min(slices, -(-(pending[0][0] - t) // quantum))
+            run = min(rem_burst_times[i], slices * quantum)
+
+        t += run
+        rem_burst_times[i] -= run
+        context_switches += slices
+
+        if rem_burst_times[i] == 0:
+            completion_time[i] = t
+            completed += 1
+        else:
+            # Newly arrived processes are queued ahead of the preempted one
+            admit_arrivals()
+            ready.append(i)
+
+    turnaround_time = [completion_time[i] - arrival_times[i] for i in range(n)]
+    waiting_time = [turnaround_time[i] - burst_times[i] for i in range(n)]
+
+    return RoundRobinResult(process_ids, burst_times, arrival_times, completion_time,
+                            waiting_time, turnaround_time, response_time, context_switches)
+
+
+def analytic_round_robin(processes, quantum):
+    """
+    Compute Round Robin results in closed form when every process arrives at t=0.
+    Processes are grouped into tiers by the round in which they finish. Between tiers, time advances by
+    (tier rounds) x (live jobs) x quantum at once, and a Fenwick tree counts the live processes that run
+    ahead of each finishing one, so the cost is O(n log n) however large the bursts are.
+    The results are identical to simulating every time slice.
+    """
+    if quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+
+    process_ids, burst_times, arrival_times = unpack_processes(processes)
+    if any(arrival_times):
+        raise ValueError("The analytic mode requires every process to arrive at t=0")
+
+    n = len(processes)
+    rounds = [-(-b // quantum) if b > 0 else 0 for b in burst_times]  # Round in which each process finishes
+    completion_time = [0] * n
+    response_time = [0] * n
+
+    # Every process is first dispatched during round 1, in input order
+    t = 0
+    for i in range(n):
+        if rounds[i]:
+            response_time[i] = t
+            t += min(burst_times[i], quantum)
+
+    # Fenwick tree (1-indexed) over the processes that are still live
+    tree = [0] * (n + 1)
+    for pos in range(1, n + 1):
+        tree[pos] += 1 if rounds[pos - 1] else 0
+        parent = pos + (pos & -pos)
+        if parent <= n:
+            tree[parent] += tree[pos]
+
+    live_count = sum(1 for r in rounds if r)
+    finished_burst = 0  # Total burst time of the processes finished in earlier tiers
+    order = sorted((i for i in range(n) if rounds[i]), key=lambda i: (rounds[i], i))
+
+    for r, tier in groupby(order, key=rounds.__getitem__):
+        tier = list(tier)
+        # Time at the start of round r: finished processes ran their whole burst, live ones r-1 quanta
+        round_start = finished_burst + (r - 1) * quantum * live_count
+        unused = 0  # Unused quantum of tier members that already finished earlier in this round
+
+        for i in tier:
+            # Count the live processes with a lower index, which all run before i in this round
+            ahead = 0
+            pos = i
+            while pos > 0:
+                ahead += tree[pos]
+                pos -= pos & -pos
+
+            remaining = burst_times[i] - (r - 1) * quantum
+            completion_time[i] = round_start + ahead * quantum - unused + remaining
+            unused += quantum - remaining
+
+        for i in tier:
+            pos = i + 1
+            while pos <= n:
+                tree[pos] -= 1
+                pos += pos & -pos
+            finished_burst += burst_times[i]
+        live_count -= len(tier)
+
+    turnaround_time = completion_time
+    waiting_time = [turnaround_time[i] - burst_times[i] for i in range(n)]
+
+    return RoundRobinResult(process_ids, burst_times, arrival_times, completion_time,
+                            waiting_time, turnaround_time, response_time, sum(rounds))
+
+
+def print_round_robin_result(result):
+    """Display a RoundRobinResult in the same table format as round_robin_scheduling."""
+    print("\nProcess ID\tBurst Time\tWaiting Time\tTurnaround Time")
+    for i in range(len(result.process_ids)):
+        print(f"{result.process_ids[i]}\t\t\t{result.burst_times[i]}\t\t\t{result.waiting_times[i]}\t\t\t\t{result.turnaround_times[i]}")
+    print(f"\nAverage Waiting Time: {result.avg_waiting}")
+    print(f"Average Turnaround Time: {result.avg_turnaround}")
+    print(f"Average Response Time: {result.avg_response}")
+    print(f"Number of context switches: {result.context_switches}")
+
+
+if __name__ == '__main__':
+    # Sample list of processes [process_id, burst_time, arrival_time]
+    processes = [[1, 10, 0], [2, 1, 1], [3, 2, 2], [4, 1, 3], [5, 5, 4]]
+    quantum = 2
+    print_round_robin_result(simulate_round_robin(processes, quantum))
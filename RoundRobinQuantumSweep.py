@@ -0,0 +1,146 @@
+"""
+This program sweeps many time quantum values (and several workloads) for Round Robin scheduling in parallel.
+Each workload is shipped to the worker processes once through shared memory, the worker pool is reused
+for every task, and the results come back as a table of averages per quantum.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import argparse
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+
+from RoundRobinEngine import analytic_round_robin, simulate_round_robin
+
+FIELDS_PER_PROCESS = 3  # Each process is stored as (process_id, burst_time, arrival_time) 64-bit integers
+
+# Workloads attached by each worker process: list of (shared memory name, number of processes)
+_worker_workloads = []
+# Workloads already copied out of shared memory by this worker, keyed by workload index
+_worker_cache = {}
+
+
+def load_workload(path):
+    """
+    Read a workload file with one "process_id burst_time [arrival_time]" entry per line.
+    Blank lines and lines starting with '#' are ignored.
+    """
+    processes = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            processes.append([int(value) for value in line.split()])
+    return processes
+
+
+def _share_workload(processes):
+    """Copy a workload into a new shared memory block and return the block."""
+    packed = array('q')
+    for p in processes:
+        packed.extend((p[0], p[1], p[2] if len(p) > 2 else 0))
+
+    shm = shared_memory.SharedMemory(create=True, size=packed.itemsize * max(len(packed), 1))
+    shm.buf[:packed.itemsize * len(packed)] = packed.tobytes()
+    return shm
+
+
+def _init_worker(workloads):
+    """Pool initializer: remember where each shared workload lives."""
+    global _worker_workloads
+    _worker_workloads = workloads
+
+
+def _get_workload(index):
+    """Return the processes of a workload, reading them from shared memory on first use."""
+    if index not in _worker_cache:
+        name, n = _worker_workloads[index]
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            view = shm.buf.cast('q')
+            values = view[:n * FIELDS_PER_PROCESS].tolist()
+            view.release()
+        finally:
+            shm.close()
+        _worker_cache[index] = [values[i:i + FIELDS_PER_PROCESS] for i in range(0, len(values), FIELDS_PER_PROCESS)]
+    return _worker_cache[index]
+
+
+def _run_quantum(task):
+    """Schedule one workload with one quantum and return its row of the sweep table."""
+    index, quantum = task
+    processes = _get_workload(index)
+
+    # The closed-form mode is exact when every process arrives at t=0
+    if all(p[2] == 0 for p in processes):
+        result = analytic_round_robin(processes, quantum)
+    else:
+        result = simulate_round_robin(processes, quantum)
+
+    return {
+        "workload": index,
+        "quantum": quantum,
+        "avg_waiting": result.avg_waiting,
+        "avg_turnaround": result.avg_turnaround,
+        "avg_response": result.avg_response,
+        "context_switches": result.context_switches,
+    }
+
+
+def sweep_quanta(processes, quanta, workers=None):
+    """
+    Run Round Robin scheduling for every quantum in `quanta` across a pool of `workers` processes.
+    `processes` is either a single list of [process_id, burst_time(, arrival_time)] entries or a dict
+    mapping workload names to such lists. Returns one row per (workload, quantum), in input order.
+    """
+    workloads = processes if isinstance(processes, dict) else {"workload": processes}
+    names = list(workloads)
+    quanta = list(quanta)
+    workers = workers or os.cpu_count()
+    if any(q <= 0 for q in quanta):
+        raise ValueError("Time quantum must be a positive integer")
+
+    blocks = []
+    try:
+        for name in names:
+            blocks.append(_share_workload(workloads[name]))
+        shared = [(shm.name, len(workloads[name])) for shm, name in zip(blocks, names)]
+        tasks = [(index, q) for index in range(len(names)) for q in quanta]
+
+        # One pool serves every task; only (workload index, quantum) pairs are pickled per task
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(shared,)) as pool:
+            rows = pool.map(_run_quantum, tasks, chunksize=max(1, len(tasks) // (4 * workers)))
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+    for row in rows:
+        row["workload"] = names[row["workload"]]
+    return rows
+
+
+def print_sweep_table(rows):
+    """Display the sweep results as a table."""
+    print("Workload\tQuantum\tAvg Waiting\tAvg Turnaround\tContext Switches")
+    for row in rows:
+        print(f"{row['workload']}\t{row['quantum']}\t{row['avg_waiting']:.2f}\t\t{row['avg_turnaround']:.2f}\t\t{row['context_switches']}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Sweep Round Robin time quanta across a process pool.")
+    parser.add_argument("workloads", nargs="*", help="workload files with 'process_id burst_time [arrival_time]' lines")
+    parser.add_argument("--quanta", type=int, nargs="+", default=[1, 2, 3, 4, 5], help="time quantum values to try")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    if args.workloads:
+        workloads = {path: load_workload(path) for path in args.workloads}
+    else:
+        # Sample list of processes [process_id, burst_time]
+        workloads = {"sample": [[1, 10], [2, 1], [3, 2], [4, 1], [5, 5]]}
+
+    print_sweep_table(sweep_quanta(workloads, args.quanta, workers=args.workers))
@@ -1,35 +1,51 @@
-def round_robin_scheduling(processes, quantum):
+from RoundRobinEngine import analytic_round_robin
+
+
+def round_robin_scheduling(processes, quantum, mode="loop"):
     """This code implements round robin scheduling algorithm
+    mode="loop" simulates every time slice. mode="analytic" works out the same results in whole rounds
+    (every process arrives at t=0), so very large bursts finish in O(n log n) instead of hanging.
+    Returns (waiting times, turnaround times, number of executed time slices) after displaying them.
     Author: Rahul Kumar
     Date: October 12, 2024
     """
+    if mode not in ("loop", "analytic"):
+        raise ValueError(f"Unknown scheduling mode: {mode}")
 
     n = len(processes)
     rem_burst_times = [p[1] for p in processes]  # Remaining burst times for each process
     waiting_time = [0] * n  # Waiting times for each process
     turnaround_time = [0] * n  # Turnaround times for each process
     t = 0  # Current time
+    slices = 0  # Number of time slices executed
+
+    if mode == "analytic":
+        # Closed-form fast path, no per-slice output
+        result = analytic_round_robin(processes, quantum)
+        waiting_time = result.waiting_times
+        slices = result.context_switches
+    else:
+        # Loop until all processes are complete
+        while any(rem_burst_times[i] > 0 for i in range(n)):
+            for i in range(n):
+                if rem_burst_times[i] > 0:  # If process has remaining burst time
+                    process_executed = False
+
+                    if rem_burst_times[i] > quantum:
+                        # Process runs for the full quantum
+                        t += quantum
+                        rem_burst_times[i] -= quantum
+                        process_executed = True
+                    else:
+                        # Process finishes its execution
+                        t += rem_burst_times[i]
+                        waiting_time[i] = t - processes[i][1]  # Calculate waiting time
+                        rem_burst_times[i] = 0  # Process completed
+                        process_executed = True
 
-    # Loop until all processes are complete
-    while any(rem_burst_times[i] > 0 for i in range(n)):
-        for i in range(n):
-            if rem_burst_times[i] > 0:  # If process has remaining burst time
-                process_executed = False
-
-                if rem_burst_times[i] > quantum:
-                    # Process runs for the full quantum
-                    t += quantum
-                    rem_burst_times[i] -= quantum
-                    process_executed = True
-                else:
-                    # Process finishes its execution
-                    t += rem_burst_times[i]
-                    waiting_time[i] = t - processes[i][1]  # Calculate waiting time
-                    rem_burst_times[i] = 0  # Process completed
-                    process_executed = True
-
-                if process_executed:
-                    print(f"Process {processes[i][0]} executed for {quantum if rem_burst_times[i] > 0 else processes[i][1]} units")
+                    if process_executed:
+                        slices += 1
+                        print(f"Process {processes[i][0]} executed for {quantum if rem_burst_times[i] > 0 else processes[i][1]} units")
 
     # Calculate turnaround time for each process
     for i in range(n):
@@ -45,6 +61,7 @@ def round_robin_scheduling(processes, quantum):
         print(f"{processes[i][0]}\t\t\t{processes[i][1]}\t\t\t{waiting_time[i]}\t\t\t\t{turnaround_time[i]}")
     print(f"\nAverage Waiting Time: {avg_waiting}")
     print(f"Average Turnaround Time: {avg_turnaround}")
+    return waiting_time, turnaround_time, slices
 
 if __name__ == '__main__':
     while True:
@@ -1,40 +1,118 @@
-def round_robin_scheduling(processes, quantum):
+import struct
+from collections import deque
+
+from RoundRobinEngine import analytic_round_robin
+
+# Binary trace record: slice end time (uint64), process id (uint32), time units (uint32), little-endian
+TRACE_RECORD = struct.Struct("<QII")
+TRACE_BUFFER_RECORDS = 65536  # Records buffered in memory before each write (1 MiB chunks)
+
+
+class TraceWriter:
+    """Writes execution-order records to a binary file in large buffered chunks."""
+
+    def __init__(self, path, buffer_records=TRACE_BUFFER_RECORDS):
+        self.file = open(path, "wb")
+        self.buffer = bytearray(TRACE_RECORD.size * buffer_records)
+        self.offset = 0  # Bytes of the buffer currently in use
+        self.records = 0  # Number of records written so far
+
+    def write(self, end_time, process_id, units):
+        TRACE_RECORD.pack_into(self.buffer, self.offset, end_time, process_id, units)
+        self.offset += TRACE_RECORD.size
+        self.records += 1
+        if self.offset == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        self.file.write(memoryview(self.buffer)[:self.offset])
+        self.offset = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_trace(path, chunk_records=TRACE_BUFFER_RECORDS):
+    """Iterate over the (end time, process id, time units) records of a binary trace file."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(TRACE_RECORD.size * chunk_records)
+            if not chunk:
+                break
+            yield from TRACE_RECORD.iter_unpack(chunk)
+
+
+def execution_order(processes, quantum):
+    """
+    Generate the execution order one time slice at a time as (process index, time units, end time)
+    tuples, in the same order as the round robin loop, without storing the whole order in memory.
+    """
+    rem_burst_times = [p[1] for p in processes]  # Remaining burst times for each process
+    ready = deque(i for i in range(len(processes)) if rem_burst_times[i] > 0)
+    t = 0  # Current time
+
+    while ready:
+        i = ready.popleft()
+        units = min(rem_burst_times[i], quantum)
+        t += units
+        rem_burst_times[i] -= units
+        yield i, units, t
+        if rem_burst_times[i] > 0:
+            ready.append(i)
+
+
+def round_robin_scheduling(processes, quantum, mode="loop", quiet=False, trace_path=None):
     """This code implements round robin scheduling algorithm
+    mode="loop" simulates every time slice. mode="analytic" works out the same results in whole rounds
+    (every process arrives at t=0), so very large bursts finish in O(n log n) instead of hanging.
+    quiet=True keeps only running aggregates and prints no per-slice output, and trace_path writes the
+    execution order to a binary trace file, so long simulations run in constant memory.
     Author: Rahul Kumar
     Date: October 12, 2024
     """
+    if mode not in ("loop", "analytic"):
+        raise ValueError(f"Unknown scheduling mode: {mode}")
+    if quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+    if mode == "analytic" and trace_path is not None:
+        raise ValueError("The analytic mode does not produce an execution trace")
 
     n = len(processes)
-    rem_burst_times = [p[1] for p in processes]  # Remaining burst times for each process
     waiting_time = [0] * n  # Waiting times for each process
     turnaround_time = [0] * n  # Turnaround times for each process
-    t = 0  # Current time
     order = []  # To track the order of execution
     context_switches = 0  # To count the number of context switches
 
-    # Loop until all processes are complete
-    while any(rem_burst_times[i] > 0 for i in range(n)):
-        for i in range(n):
-            if rem_burst_times[i] > 0:  # If process has remaining burst time
-                process_executed = False
-
-                if rem_burst_times[i] > quantum:
-                    # Process runs for the full quantum
-                    t += quantum
-                    rem_burst_times[i] -= quantum
-                    order.append((processes[i][0], quantum))  # Track execution order
-                    process_executed = True
-                else:
-                    # Process finishes its execution
-                    t += rem_burst_times[i]
-                    waiting_time[i] = t - processes[i][1]  # Calculate waiting time
-                    order.append((processes[i][0], rem_burst_times[i]))  # Track remaining burst time
-                    rem_burst_times[i] = 0  # Process completed
-                    process_executed = True
-
-                if process_executed:
-                    context_switches += 1  # Increment context switch count
-                    print(f"Process {processes[i][0]} executed for {order[-1][1]} units")
+    if mode == "analytic":
+        # Closed-form fast path, the execution order is not tracked slice by slice
+        result = analytic_round_robin(processes, quantum)
+        waiting_time = result.waiting_times
+        context_switches = result.context_switches
+    else:
+        rem_burst_times = [p[1] for p in processes]  # Remaining burst times for each process
+        trace = TraceWriter(trace_path) if trace_path is not None else None
+        try:
+            for i, units, t in execution_order(processes, quantum):
+                context_switches += 1  # Increment context switch count
+                rem_burst_times[i] -= units
+                if rem_burst_times[i] == 0:
+                    waiting_time[i] = t - processes[i][1]  # Process completed, calculate waiting time
+
+                if trace is not None:
+                    trace.write(t, processes[i][0], units)
+                if not quiet:
+                    order.append((processes[i][0], units))  # Track execution order
+                    print(f"Process {processes[i][0]} executed for {units} units")
+        finally:
+            if trace is not None:
+                trace.close()
 
     # Calculate turnaround time for each process
     for i in range(n):
@@ -45,6 +123,12 @@ def round_robin_scheduling(processes, quantum):
     avg_turnaround = sum(turnaround_time) / n
 
     # Display results
+    if quiet:
+        print(f"\nAverage Waiting Time: {avg_waiting}")
+        print(f"Average Turnaround Time: {avg_turnaround}")
+        print(f"Number of context switches: {context_switches}")
+        return
+
     print("\nProcess ID\tBurst Time\tWaiting Time\tTurnaround Time")
     for i in range(n):
         print(f"{processes[i][0]}\t\t\t{processes[i][1]}\t\t\t{waiting_time[i]}\t\t\t\t{turnaround_time[i]}")
@@ -52,9 +136,10 @@ def round_robin_scheduling(processes, quantum):
     print(f"Average Turnaround Time: {avg_turnaround}")
 
     # Print execution order and context switch count
-    print("\nExecution Order (Process ID, Time Units):")
-    for proc in order:
-        print(f"Process {proc[0]} executed for {proc[1]} units")
+    if mode == "loop":
+        print("\nExecution Order (Process ID, Time Units):")
+        for proc in order:
+            print(f"Process {proc[0]} executed for {proc[1]} units")
 
     print(f"Number of context switches: {context_switches}")
 
@@ -0,0 +1,164 @@
+"""
+This program replays multi-tenant address traces, where every access is tagged with the address space (ASID)
+of the process that made it. The parallel mode shards the trace by ASID across a multiprocessing pool; each
+ASID gets its own page table and TLB, and the per-worker counters are merged afterwards. The shared-TLB mode
+replays the interleaved trace through one TLB with ASID-tagged entries (or one that is flushed on every context
+switch) to measure what context switches cost in TLB hit rate.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import multiprocessing
+import os
+import random
+from dataclasses import dataclass, field
+
+from DemandPaging import DemandPagingSimulator
+from TLBPolicies import TLB
+from TwoLevelPageTableTLBSimulation import FRAME_SIZE, TLB_SIZE
+
+
+@dataclass
+class ReplayStats:
+    """Mergeable replay counters, in total and per ASID."""
+    accesses: int = 0
+    tlb_hits: int = 0
+    tlb_misses: int = 0
+    page_faults: int = 0
+    context_switches: int = 0
+    per_asid: dict = field(default_factory=dict)  # ASID -> [accesses, TLB hits, page faults]
+
+    def add(self, asid, simulator):
+        """Add the counters of one ASID's DemandPagingSimulator."""
+        self.accesses += simulator.accesses
+        self.tlb_hits += simulator.tlb_hits
+        self.tlb_misses += simulator.accesses - simulator.tlb_hits
+        self.page_faults += simulator.page_faults
+        self.per_asid[asid] = [simulator.accesses, simulator.tlb_hits, simulator.page_faults]
+
+    def merge(self, other):
+        """Fold another ReplayStats into this one and return self."""
+        self.accesses += other.accesses
+        self.tlb_hits += other.tlb_hits
+        self.tlb_misses += other.tlb_misses
+        self.page_faults += other.page_faults
+        self.context_switches += other.context_switches
+        for asid, counts in other.per_asid.items():
+            merged = self.per_asid.setdefault(asid, [0, 0, 0])
+            for k in range(len(counts)):
+                merged[k] += counts[k]
+        return self
+
+    @property
+    def hit_rate(self):
+        return self.tlb_hits / self.accesses * 100 if self.accesses > 0 else 0
+
+    def hit_rate_histogram(self, bins=10):
+        """Count the ASIDs whose TLB hit rate falls in each of `bins` equal-width buckets from 0% to 100%."""
+        histogram = [0] * bins
+        for accesses, tlb_hits, _ in self.per_asid.values():
+            if accesses:
+                histogram[min(tlb_hits * bins // accesses, bins - 1)] += 1
+        return histogram
+
+
+def split_by_asid(trace):
+    """Group an interleaved trace of (asid, virtual_address) pairs into one address list per ASID."""
+    streams = {}
+    for asid, virtual_address in trace:
+        streams.setdefault(asid, []).append(virtual_address)
+    return streams
+
+
+def _replay_shard(task):
+    """Worker: replay every ASID stream of a shard with its own page table and TLB."""
+    shard, num_frames, tlb_entries, policy = task
+    stats = ReplayStats()
+    for asid, addresses in shard:
+        simulator = DemandPagingSimulator(num_frames, policy, TLB(tlb_entries), asid=asid)
+        for virtual_address in addresses:
+            simulator.access(virtual_address)
+        stats.add(asid, simulator)
+    return stats
+
+
+def sharded_replay(trace, workers=None, num_frames=64, tlb_entries=TLB_SIZE, policy="lru"):
+    """
+    Replay a trace of (asid, virtual_address) pairs in parallel, one shard of ASIDs per task,
+    and return the merged ReplayStats.
+    """
+    streams = split_by_asid(trace)
+    workers = workers or os.cpu_count()
+
+    # Balance the shards: longest streams first, each onto the currently lightest shard
+    shards = [[] for _ in range(min(workers, len(streams)) or 1)]
+    loads = [0] * len(shards)
+    for asid in sorted(streams, key=lambda a: len(streams[a]), reverse=True):
+        lightest = loads.index(min(loads))
+        shards[lightest].append((asid, streams[asid]))
+        loads[lightest] += len(streams[asid])
+
+    tasks = [(shard, num_frames, tlb_entries, policy) for shard in shards]
+    with multiprocessing.Pool(len(shards)) as pool:
+        results = pool.map(_replay_shard, tasks)
+
+    stats = ReplayStats()
+    for result in results:
+        stats.merge(result)
+    return stats
+
+
+def shared_tlb_replay(trace, num_frames=64, tlb_entries=TLB_SIZE, policy="lru", flush_on_switch=False):
+    """
+    Replay an interleaved trace of (asid, virtual_address) pairs through one TLB shared by every ASID.
+    Entries are tagged with the ASID, so they survive context switches unless flush_on_switch is set,
+    which models a TLB without ASID tags.
+    """
+    tlb = TLB(tlb_entries)
+    simulators = {}
+    stats = ReplayStats()
+    current_asid = None
+
+    for asid, virtual_address in trace:
+        if asid != current_asid:
+            if current_asid is not None:
+                stats.context_switches += 1
+                if flush_on_switch:
+                    tlb.flush()
+            current_asid = asid
+        simulator = simulators.get(asid)
+        if simulator is None:
+            simulator = simulators[asid] = DemandPagingSimulator(num_frames, policy, tlb, asid=asid)
+        simulator.access(virtual_address)
+
+    for asid, simulator in simulators.items():
+        stats.add(asid, simulator)
+    return stats
+
+
+def print_replay_stats(name, stats):
+    """Display merged replay counters and the per-ASID hit-rate histogram."""
+    print(f"\n{name}")
+    print(f"Total Accesses: {stats.accesses}")
+    print(f"TLB Hits: {stats.tlb_hits}")
+    print(f"TLB Misses: {stats.tlb_misses}")
+    print(f"Page Faults: {stats.page_faults}")
+    print(f"Context Switches: {stats.context_switches}")
+    print(f"TLB Hit Rate: {stats.hit_rate:.2f}%")
+    print("Per-ASID Hit Rate Histogram:")
+    for bucket, count in enumerate(stats.hit_rate_histogram()):
+        print(f"  {bucket * 10:3d}-{bucket * 10 + 10:3d}%: {count}")
+
+
+if __name__ == '__main__':
+    # 16 processes, each touching its own small working set, scheduled in bursts of 50 accesses
+    num_asids, burst, num_bursts = 16, 50, 2000
+    trace = []
+    for _ in range(num_bursts):
+        asid = random.randrange(num_asids)
+        working_set = 4 + asid % 8
+        trace.extend((asid, random.randrange(working_set) * FRAME_SIZE) for _ in range(burst))
+
+    print_replay_stats("Sharded Replay (private TLB per ASID)", sharded_replay(trace, workers=4))
+    print_replay_stats("Shared TLB with ASID Tags", shared_tlb_replay(trace, tlb_entries=64))
+    print_replay_stats("Shared TLB Flushed on Context Switch", shared_tlb_replay(trace, tlb_entries=64, flush_on_switch=True))
@@ -0,0 +1,150 @@
+"""
+This program implements a shared-memory ring buffer transport for IPC between child processes and a parent.
+Each child gets its own single-producer/single-consumer ring in a multiprocessing.shared_memory block with
+fixed-size slots. The producer only writes the tail index and the consumer only writes the head index, so no
+locks are needed, and a message costs one copy into the slot instead of a pickle, a pipe write and a feeder
+thread handoff as with multiprocessing.Queue. The parent drains all rings through the same get() API as a queue.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import queue
+import struct
+import time
+from multiprocessing import shared_memory
+
+LENGTH = struct.Struct("<I")  # Length prefix of each slot
+HEAD = 0  # Head counter (written by the consumer), in 8-byte words, on its own cache line
+TAIL = 8  # Tail counter (written by the producer), in 8-byte words, on its own cache line
+HEADER_SIZE = 128
+
+
+class RingBuffer:
+    """
+    One single-producer/single-consumer ring of `num_slots` slots of `slot_size` bytes each.
+    The counters only grow; slot i holds message number i modulo num_slots.
+    """
+
+    def __init__(self, num_slots=1024, slot_size=256, name=None):
+        if num_slots <= 0 or slot_size <= LENGTH.size:
+            raise ValueError("The ring needs at least one slot larger than the length prefix")
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self.owner = name is None  # The creating process unlinks the block
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + num_slots * slot_size)
+            self.shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.buf = self.shm.buf
+        # The counters are accessed as native aligned 64-bit words, so each update is a single store
+        # (struct's "<Q" packing writes byte by byte and the other process could see a torn value)
+        self.counters = self.buf[:HEADER_SIZE].cast('Q')
+        # Local copies of our own counter, so only the other side's counter is read from shared memory
+        self.head = self.counters[HEAD]
+        self.tail = self.counters[TAIL]
+
+    def __getstate__(self):
+        # Only the block name travels to the child process; it attaches on unpickling
+        return {"name": self.shm.name, "num_slots": self.num_slots, "slot_size": self.slot_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["num_slots"], state["slot_size"], state["name"])
+
+    def put_bytes(self, data, timeout=None):
+        """Copy one message into the next slot, waiting while the ring is full."""
+        if len(data) > self.slot_size - LENGTH.size:
+            raise ValueError(f"Message of {len(data)} bytes does not fit in a {self.slot_size}-byte slot")
+        if self.tail - self.counters[HEAD] >= self.num_slots:
+            _wait(lambda: True if self.tail - self.counters[HEAD] < self.num_slots else None, timeout, queue.Full)
+
+        offset = HEADER_SIZE + (self.tail % self.num_slots) * self.slot_size
+        LENGTH.pack_into(self.buf, offset, len(data))
+        self.buf[offset + LENGTH.size:offset + LENGTH.size + len(data)] = data
+        # Publish the slot only after its contents are written
+        self.tail += 1
+        self.counters[TAIL] = self.tail
+
+    def get_bytes_nowait(self):
+        """Return the next message as bytes, or None if the ring is empty."""
+        if self.head == self.counters[TAIL]:
+            return None
+        offset = HEADER_SIZE + (self.head % self.num_slots) * self.slot_size
+        length = LENGTH.unpack_from(self.buf, offset)[0]
+        data = bytes(self.buf[offset + LENGTH.size:offset + LENGTH.size + length])
+        # Hand the slot back to the producer only after it has been copied out
+        self.head += 1
+        self.counters[HEAD] = self.head
+        return data
+
+    def __del__(self):
+        # A child that exits without close() must still drop its header view, or the block cannot be unmapped
+        if getattr(self, "counters", None) is not None:
+            self.counters.release()
+
+    def put(self, message, timeout=None):
+        """Send a string message, like Queue.put."""
+        self.put_bytes(message.encode(), timeout)
+
+    def close(self):
+        self.counters.release()
+        self.counters = self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class RingBufferQueue:
+    """
+    One RingBuffer per producer, drained by the parent through a Queue-like get().
+    Messages from the same producer arrive in order; producers are served round-robin.
+    """
+
+    def __init__(self, num_producers, num_slots=1024, slot_size=256):
+        self.rings = [RingBuffer(num_slots, slot_size) for _ in range(num_producers)]
+        self.next_ring = 0
+
+    def producer(self, index):
+        """Return the ring a child process should pass to childProcess in place of the queue."""
+        return self.rings[index]
+
+    def get_bytes(self, block=True, timeout=None):
+        """Return the next message from any ring as bytes, waiting if every ring is empty."""
+        data = self._poll()
+        if data is None:
+            if not block:
+                raise queue.Empty
+            data = _wait(self._poll, timeout, queue.Empty)
+        return data
+
+    def get(self, block=True, timeout=None):
+        """Return the next string message, like Queue.get."""
+        return self.get_bytes(block, timeout).decode()
+
+    def _poll(self):
+        # Try every ring once, starting after the one served last
+        for _ in range(len(self.rings)):
+            ring = self.rings[self.next_ring]
+            self.next_ring = (self.next_ring + 1) % len(self.rings)
+            data = ring.get_bytes_nowait()
+            if data is not None:
+                return data
+        return None
+
+    def close(self):
+        for ring in self.rings:
+            ring.close()
+
+
+def _wait(poll, timeout, exception):
+    """Spin on poll() with an increasing back-off until it returns something other than None or the timeout expires."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0
+    while True:
+        result = poll()
+        if result is not None:
+            return result
+        if deadline is not None and time.monotonic() >= deadline:
+            raise exception
+        time.sleep(delay)
+        delay = min(delay * 2 or 1e-6, 1e-3)
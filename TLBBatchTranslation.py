@@ -0,0 +1,101 @@
+"""
+This program translates whole arrays of virtual addresses at once for the two-level page table simulator.
+Level 1 / level 2 indices and offsets are extracted with vectorized shifts and masks, frames are looked up
+in an array-backed copy of the page table, and the TLB is still honored through a chunked LRU pass.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+from collections import OrderedDict
+
+import numpy as np  # For vectorized address translation
+
+import TwoLevelPageTableTLBSimulation as sim
+
+CHUNK_SIZE = 1 << 20  # Addresses handled per LRU pass
+
+
+def build_frame_table(page_table):
+    """
+    Convert the dict-of-dicts page table into a flat array indexed by virtual page number
+    ((level_1_index << LEVEL_2_BITS) | level_2_index). Missing entries hold -1.
+    """
+    frame_table = np.full((1 << sim.LEVEL_1_BITS) * (1 << sim.LEVEL_2_BITS), -1, dtype=np.int64)
+    for level_1_index, level_2_table in page_table.items():
+        for level_2_index, frame in level_2_table.items():
+            frame_table[(level_1_index << sim.LEVEL_2_BITS) | level_2_index] = frame
+    return frame_table
+
+
+def _lru_pass(pages, frames, valid, tlb):
+    """
+    Run the TLB's LRU policy over one chunk of virtual page numbers and return the hit mask.
+    An access to the same page as the previous one is always a hit, so only the first access of each
+    run of repeated pages goes through the (pure Python) LRU bookkeeping.
+    """
+    hits = np.zeros(len(pages), dtype=bool)
+    repeat = np.zeros(len(pages), dtype=bool)
+    repeat[1:] = pages[1:] == pages[:-1]
+    hits[repeat & valid] = True
+
+    heads = np.flatnonzero(~repeat & valid)
+    for index, page, frame in zip(heads.tolist(), pages[heads].tolist(), frames[heads].tolist()):
+        if page in tlb:
+            tlb.move_to_end(page)
+            hits[index] = True
+        else:
+            tlb[page] = frame
+            if len(tlb) > sim.TLB_SIZE:
+                tlb.popitem(last=False)
+    return hits
+
+
+def translate_batch(addresses, frame_table=None, use_tlb=True):
+    """
+    Translate an array of virtual addresses.
+    Returns (physical_addresses, fault_mask, tlb_hit_mask); physical addresses are -1 where a page fault occurred.
+    The module-level TLB in TwoLevelPageTableTLBSimulation is read before and updated after the batch,
+    so batch and single-address translation can be mixed.
+    """
+    addresses = np.asarray(addresses, dtype=np.int64)
+    if frame_table is None:
+        frame_table = build_frame_table(sim.page_table)
+
+    # Extract Level 1 index, Level 2 index, and offset with vectorized bit manipulation
+    level_1_index = (addresses >> (sim.LEVEL_2_BITS + sim.OFFSET_BITS)) & sim.LEVEL_1_MASK
+    level_2_index = (addresses >> sim.OFFSET_BITS) & sim.LEVEL_2_MASK
+    offset = addresses & sim.OFFSET_MASK
+    pages = (level_1_index << sim.LEVEL_2_BITS) | level_2_index
+
+    frames = frame_table[pages]
+    fault_mask = frames < 0
+    physical_addresses = np.where(fault_mask, -1, (frames << sim.OFFSET_BITS) | offset)
+    hit_mask = np.zeros(len(addresses), dtype=bool)
+
+    if use_tlb:
+        # Work on a page-number keyed copy of the TLB, keeping its LRU order
+        tlb = OrderedDict(((l1 << sim.LEVEL_2_BITS) | l2, frame) for (l1, l2), frame in sim.tlb.items())
+        for start in range(0, len(addresses), CHUNK_SIZE):
+            end = start + CHUNK_SIZE
+            hit_mask[start:end] = _lru_pass(pages[start:end], frames[start:end], ~fault_mask[start:end], tlb)
+
+        # Write the LRU state back to the simulator's TLB
+        sim.tlb.clear()
+        for page, frame in tlb.items():
+            sim.tlb[(page >> sim.LEVEL_2_BITS, page & sim.LEVEL_2_MASK)] = frame
+
+    return physical_addresses, fault_mask, hit_mask
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(2024)
+    address_space = sim.PAGE_TABLE_LEVEL_1_SIZE * sim.PAGE_TABLE_LEVEL_2_SIZE * sim.FRAME_SIZE
+    addresses = rng.integers(0, address_space, size=1_000_000)
+
+    physical_addresses, fault_mask, hit_mask = translate_batch(addresses)
+    print("Batch Simulation Results:")
+    print(f"Total Accesses: {len(addresses)}")
+    print(f"TLB Hits: {int(hit_mask.sum())}")
+    print(f"TLB Misses: {len(addresses) - int(hit_mask.sum())}")
+    print(f"Page Faults: {int(fault_mask.sum())}")
+    print(f"TLB Hit Rate: {hit_mask.mean() * 100:.2f}%")
@@ -0,0 +1,352 @@
+"""
+This program models a TLB with pluggable replacement policies and configurable associativity.
+Policies: LRU, FIFO, CLOCK, random, 2Q and offline Belady/OPT (an upper bound on the hit rate).
+Associativity: direct-mapped (1 way), N-way set-associative, or fully associative (one set).
+Every policy does O(1) bookkeeping per access, except OPT, which keeps a heap per set after
+precomputing the next use of every access in one backward pass over the trace.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import heapq
+import random
+from collections import OrderedDict
+
+from TwoLevelPageTableTLBSimulation import (FRAME_SIZE, LEVEL_1_BITS, LEVEL_2_BITS, OFFSET_BITS,
+                                            PAGE_TABLE_LEVEL_1_SIZE, PAGE_TABLE_LEVEL_2_SIZE, TLB_SIZE, page_table)
+
+PAGE_MASK = (1 << (LEVEL_1_BITS + LEVEL_2_BITS)) - 1
+NEVER = float('inf')  # Next use of a page that is not accessed again
+
+
+class LRUSet:
+    """Least recently used: hits move the page to the most recently used end."""
+
+    def __init__(self, ways, rng=None):
+        self.ways = ways
+        self.entries = OrderedDict()
+
+    def __contains__(self, page):
+        return page in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, page, next_use=None):
+        frame = self.entries.get(page)
+        if frame is not None:
+            self.entries.move_to_end(page)
+        return frame
+
+    def insert(self, page, frame, next_use=None):
+        """Insert a missing page and return the evicted page (or None)."""
+        evicted = None
+        if len(self.entries) >= self.ways:
+            evicted = self.entries.popitem(last=False)[0]
+        self.entries[page] = frame
+        return evicted
+
+    def remove(self, page):
+        self.entries.pop(page, None)
+
+
+class FIFOSet(LRUSet):
+    """First in, first out: hits do not change the eviction order."""
+
+    def lookup(self, page, next_use=None):
+        return self.entries.get(page)
+
+
+class ClockSet:
+    """CLOCK (second chance): a hand sweeps the slots and evicts the first page whose reference bit is clear."""
+
+    def __init__(self, ways, rng=None):
+        self.ways = ways
+        self.pages = [None] * ways
+        self.frames = [None] * ways
+        self.referenced = [False] * ways
+        self.slot_of_page = {}
+        self.free_slots = list(range(ways - 1, -1, -1))
+        self.hand = 0
+
+    def __contains__(self, page):
+        return page in self.slot_of_page
+
+    def __len__(self):
+        return len(self.slot_of_page)
+
+    def lookup(self, page, next_use=None):
+        slot = self.slot_of_page.get(page)
+        if slot is None:
+            return None
+        self.referenced[slot] = True
+        return self.frames[slot]
+
+    def insert(self, page, frame, next_use=None):
+        evicted = None
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            # Give referenced pages a second chance until an unreferenced one is found
+            while self.referenced[self.hand]:
+                self.referenced[self.hand] = False
+                self.hand = (self.hand + 1) % self.ways
+            slot = self.hand
+            evicted = self.pages[slot]
+            del self.slot_of_page[evicted]
+            self.hand = (slot + 1) % self.ways
+        self.pages[slot] = page
+        self.frames[slot] = frame
+        self.referenced[slot] = False
+        self.slot_of_page[page] = slot
+        return evicted
+
+    def remove(self, page):
+        slot = self.slot_of_page.pop(page, None)
+        if slot is not None:
+            self.pages[slot] = None
+            self.frames[slot] = None
+            self.referenced[slot] = False
+            self.free_slots.append(slot)
+
+
+class RandomSet:
+    """Random replacement: evicts a uniformly random resident page."""
+
+    def __init__(self, ways, rng=None):
+        self.ways = ways
+        self.rng = rng or random.Random()
+        self.pages = []
+        self.entries = {}  # page -> (frame, position in self.pages)
+
+    def __contains__(self, page):
+        return page in self.entries
+
+    def __len__(self):
+        return len(self.pages)
+
+    def lookup(self, page, next_use=None):
+        entry = self.entries.get(page)
+        return entry[0] if entry is not None else None
+
+    def insert(self, page, frame, next_use=None):
+        evicted = None
+        if len(self.pages) >= self.ways:
+            evicted = self.pages[self.rng.randrange(len(self.pages))]
+            self.remove(evicted)
+        self.entries[page] = (frame, len(self.pages))
+        self.pages.append(page)
+        return evicted
+
+    def remove(self, page):
+        entry = self.entries.pop(page, None)
+        if entry is None:
+            return
+        # Swap the last page into the freed position
+        last = self.pages.pop()
+        if last != page:
+            self.pages[entry[1]] = last
+            self.entries[last] = (self.entries[last][0], entry[1])
+
+
+class TwoQueueSet:
+    """
+    2Q: new pages enter a FIFO queue (A1in); pages evicted from it are remembered in a ghost queue (A1out),
+    and a page that misses while remembered there is promoted into the main LRU queue (Am).
+    This keeps one-time scans from flushing the frequently used pages.
+    """
+
+    def __init__(self, ways, rng=None):
+        self.ways = ways
+        self.in_limit = max(1, ways // 4)
+        self.out_limit = max(1, ways // 2)
+        self.a1_in = OrderedDict()
+        self.a1_out = OrderedDict()  # Ghost entries: page ids only
+        self.am = OrderedDict()
+
+    def __contains__(self, page):
+        return page in self.a1_in or page in self.am
+
+    def __len__(self):
+        return len(self.a1_in) + len(self.am)
+
+    def lookup(self, page, next_use=None):
+        frame = self.am.get(page)
+        if frame is not None:
+            self.am.move_to_end(page)
+            return frame
+        return self.a1_in.get(page)
+
+    def insert(self, page, frame, next_use=None):
+        evicted = None
+        if len(self) >= self.ways:
+            if len(self.a1_in) > self.in_limit or not self.am:
+                evicted = self.a1_in.popitem(last=False)[0]
+                self.a1_out[evicted] = None
+                if len(self.a1_out) > self.out_limit:
+                    self.a1_out.popitem(last=False)
+            else:
+                evicted = self.am.popitem(last=False)[0]
+
+        if page in self.a1_out:
+            del self.a1_out[page]
+            self.am[page] = frame
+        else:
+            self.a1_in[page] = frame
+        return evicted
+
+    def remove(self, page):
+        self.a1_in.pop(page, None)
+        self.am.pop(page, None)
+
+
+class OPTSet:
+    """
+    Belady's optimal policy: evicts the page whose next use is farthest in the future.
+    It needs the next use of every access (see compute_next_use), so it only works offline.
+    """
+
+    def __init__(self, ways, rng=None):
+        self.ways = ways
+        self.entries = {}  # page -> (frame, next use)
+        self.heap = []  # (-next use, page), stale entries are skipped lazily
+
+    def __contains__(self, page):
+        return page in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, page, next_use=None):
+        entry = self.entries.get(page)
+        if entry is None:
+            return None
+        self._update(page, entry[0], next_use)
+        return entry[0]
+
+    def insert(self, page, frame, next_use=None):
+        evicted = None
+        if len(self.entries) >= self.ways:
+            while True:
+                negative_next_use, candidate = heapq.heappop(self.heap)
+                entry = self.entries.get(candidate)
+                if entry is not None and entry[1] == -negative_next_use:
+                    break
+            evicted = candidate
+            del self.entries[evicted]
+        self._update(page, frame, next_use)
+        return evicted
+
+    def _update(self, page, frame, next_use):
+        self.entries[page] = (frame, next_use)
+        heapq.heappush(self.heap, (-next_use, page))
+        if len(self.heap) > 4 * self.ways + 16:
+            # Drop the stale heap entries
+            self.heap = [(-entry[1], p) for p, entry in self.entries.items()]
+            heapq.heapify(self.heap)
+
+    def remove(self, page):
+        self.entries.pop(page, None)
+
+
+POLICIES = {
+    "lru": LRUSet,
+    "fifo": FIFOSet,
+    "clock": ClockSet,
+    "random": RandomSet,
+    "2q": TwoQueueSet,
+    "opt": OPTSet,
+}
+
+
+def compute_next_use(pages):
+    """Return, for every access, the index of the next access to the same page (NEVER if none), in one backward pass."""
+    next_use = [NEVER] * len(pages)
+    last_seen = {}
+    for i in range(len(pages) - 1, -1, -1):
+        next_use[i] = last_seen.get(pages[i], NEVER)
+        last_seen[pages[i]] = i
+    return next_use
+
+
+class TLB:
+    """
+    Set-associative TLB with a pluggable replacement policy. Pages are integers, and a page maps to
+    set (page % number of sets). ways=None gives a fully associative TLB, ways=1 a direct-mapped one.
+    The "opt" policy needs the trace's next-use indices (compute_next_use) and one access() per trace entry.
+    """
+
+    def __init__(self, num_entries=TLB_SIZE, ways=None, policy="lru", next_use=None, seed=None):
+        ways = ways or num_entries
+        if num_entries <= 0 or ways <= 0 or num_entries % ways:
+            raise ValueError("The number of entries must be a positive multiple of the associativity")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown TLB replacement policy: {policy}")
+        if policy == "opt" and next_use is None:
+            raise ValueError("The OPT policy needs the next-use indices of the trace")
+
+        self.policy = POLICIES[policy]
+        self.ways = ways
+        self.rng = random.Random(seed)
+        self.num_sets = num_entries // ways
+        self.sets = [self.policy(ways, self.rng) for _ in range(self.num_sets)]
+        self.next_use = next_use
+        self.time = 0  # Index of the current access in the trace (used by OPT)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def access(self, page, frame):
+        """Look up a page, inserting it with the given frame on a miss. Returns True on a TLB hit."""
+        tlb_set = self.sets[page % self.num_sets]
+        next_use = self.next_use[self.time] if self.next_use is not None else None
+        self.time += 1
+
+        if tlb_set.lookup(page, next_use) is not None:
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        if tlb_set.insert(page, frame, next_use) is not None:
+            self.evictions += 1
+        return False
+
+    def invalidate(self, page):
+        """Remove a page from the TLB (used for TLB shootdowns)."""
+        self.sets[page % self.num_sets].remove(page)
+
+    def flush(self):
+        """Remove every entry, keeping the counters."""
+        self.sets = [self.policy(self.ways, self.rng) for _ in range(self.num_sets)]
+
+    @property
+    def hit_rate(self):
+        accesses = self.hits + self.misses
+        return self.hits / accesses * 100 if accesses > 0 else 0
+
+
+def simulate_tlb(access_pattern, policy="lru", num_entries=TLB_SIZE, ways=None, seed=None):
+    """
+    Replay an access pattern against the simulator's page table through a TLB with the given policy
+    and associativity. Returns the TLB with its counters.
+    """
+    pages = [(virtual_address >> OFFSET_BITS) & PAGE_MASK for virtual_address in access_pattern]
+    next_use = compute_next_use(pages) if policy == "opt" else None
+    tlb = TLB(num_entries, ways, policy, next_use, seed)
+    for page in pages:
+        tlb.access(page, page_table[page >> LEVEL_2_BITS][page & ((1 << LEVEL_2_BITS) - 1)])
+    return tlb
+
+
+if __name__ == '__main__':
+    address_space = PAGE_TABLE_LEVEL_1_SIZE * PAGE_TABLE_LEVEL_2_SIZE * FRAME_SIZE
+    random_access_pattern = [random.randint(0, address_space - 1) for _ in range(10000)]
+    looped_access_pattern = list(range(0, 10 * FRAME_SIZE, FRAME_SIZE)) * 1000
+
+    for name, access_pattern in (("Random", random_access_pattern), ("Looped", looped_access_pattern)):
+        print(f"\n{name} Access Pattern")
+        print("Policy\tDirect-Mapped\t2-Way\t\tFully Associative")
+        for policy in POLICIES:
+            rates = [simulate_tlb(access_pattern, policy, TLB_SIZE, ways, seed=2024).hit_rate
+                     for ways in (1, 2, None)]
+            print(f"{policy}\t{rates[0]:.2f}%\t\t{rates[1]:.2f}%\t\t{rates[2]:.2f}%")
@@ -0,0 +1,124 @@
+"""
+This program computes the TLB hit rate for every TLB size in a single pass over an address trace.
+It uses LRU stack distances (Mattson's algorithm): an access hits in an LRU TLB of size k exactly when
+fewer than k distinct virtual pages were touched since the previous access to the same page.
+A Fenwick tree over the most recent access of each page counts those distinct pages in O(log M).
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import random
+
+from TwoLevelPageTableTLBSimulation import (FRAME_SIZE, LEVEL_1_BITS, LEVEL_2_BITS, OFFSET_BITS,
+                                            PAGE_TABLE_LEVEL_1_SIZE, PAGE_TABLE_LEVEL_2_SIZE)
+
+PAGE_MASK = (1 << (LEVEL_1_BITS + LEVEL_2_BITS)) - 1
+
+
+def virtual_page(virtual_address):
+    """
+    Return the virtual page key of an address. It packs the same (level_1_index, level_2_index)
+    pair that translate_address uses as its TLB key into a single integer.
+    """
+    return (virtual_address >> OFFSET_BITS) & PAGE_MASK
+
+
+def stack_distance_histogram(access_pattern):
+    """
+    Return (histogram, cold_misses) where histogram[d] counts the accesses with stack distance d,
+    i.e. d distinct other pages were accessed since the previous access to the same page.
+    Slots of the Fenwick tree are renumbered when they run out, so it only grows with the number of
+    distinct pages M and each access costs O(log M).
+    """
+    histogram = []
+    cold_misses = 0
+    slot_of_page = {}  # Slot holding the most recent access of each page
+    capacity = 1024
+    tree = [0] * (capacity + 1)  # Fenwick tree (1-indexed) marking the live slots
+    next_slot = 1
+
+    for virtual_address in access_pattern:
+        page = virtual_page(virtual_address)
+        slot = slot_of_page.get(page)
+
+        if slot is None:
+            cold_misses += 1
+        else:
+            # Live slots after this one belong to distinct pages accessed since the last visit
+            before = 0
+            pos = slot
+            while pos > 0:
+                before += tree[pos]
+                pos -= pos & -pos
+            distance = len(slot_of_page) - before
+            if distance >= len(histogram):
+                histogram.extend([0] * (distance + 1 - len(histogram)))
+            histogram[distance] += 1
+
+            pos = slot
+            while pos <= capacity:
+                tree[pos] -= 1
+                pos += pos & -pos
+
+        if next_slot > capacity:
+            # Renumber the live slots 1..M in recency order and rebuild the tree
+            pages = sorted(slot_of_page, key=slot_of_page.get)
+            if slot is not None:
+                pages.remove(page)
+            capacity = max(capacity, 2 * (len(pages) + 1))
+            tree = [0] * (capacity + 1)
+            for new_slot, p in enumerate(pages, start=1):
+                slot_of_page[p] = new_slot
+            for pos in range(1, capacity + 1):
+                tree[pos] += 1 if pos <= len(pages) else 0
+                parent = pos + (pos & -pos)
+                if parent <= capacity:
+                    tree[parent] += tree[pos]
+            next_slot = len(pages) + 1
+
+        slot_of_page[page] = next_slot
+        pos = next_slot
+        while pos <= capacity:
+            tree[pos] += 1
+            pos += pos & -pos
+        next_slot += 1
+
+    return histogram, cold_misses
+
+
+def hit_rate_curve(access_pattern, max_tlb_size=None):
+    """
+    Return a list whose entry k-1 is the LRU TLB hit rate (in percent) for a TLB of size k,
+    for every size from 1 up to the number of distinct pages (or max_tlb_size).
+    """
+    histogram, cold_misses = stack_distance_histogram(access_pattern)
+    total = sum(histogram) + cold_misses
+    if max_tlb_size is None:
+        # Every distinct page misses cold exactly once, so cold_misses is the number of distinct pages M
+        max_tlb_size = max(cold_misses, 1)
+
+    curve = []
+    hits = 0
+    for size in range(1, max_tlb_size + 1):
+        hits += histogram[size - 1] if size - 1 < len(histogram) else 0
+        curve.append(hits / total * 100 if total > 0 else 0)
+    return curve
+
+
+def print_hit_rate_curve(curve):
+    """Display the hit rate for every TLB size."""
+    print("TLB Size\tTLB Hit Rate")
+    for size, hit_rate in enumerate(curve, start=1):
+        print(f"{size}\t\t{hit_rate:.2f}%")
+
+
+if __name__ == '__main__':
+    address_space = PAGE_TABLE_LEVEL_1_SIZE * PAGE_TABLE_LEVEL_2_SIZE * FRAME_SIZE
+
+    print("Test Case 1: Random Access Pattern")
+    random_access_pattern = [random.randint(0, address_space - 1) for _ in range(50)]
+    print_hit_rate_curve(hit_rate_curve(random_access_pattern))
+
+    print("\nTest Case 2: Repeated Access to Small Subset")
+    repeated_access_pattern = [0, FRAME_SIZE, 2 * FRAME_SIZE, 0, FRAME_SIZE, 2 * FRAME_SIZE] * 5
+    print_hit_rate_curve(hit_rate_curve(repeated_access_pattern))
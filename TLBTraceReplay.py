@@ -0,0 +1,92 @@
+"""
+This program replays very large address traces through the two-level page table and TLB simulator.
+Traces are binary files of packed virtual addresses (uint32 or uint64, native byte order) that are
+memory-mapped and handed to simulate_address_access in fixed-size zero-copy chunks, so peak memory stays
+flat no matter how long the trace is. A text importer converts a trace with one address per line once.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import argparse
+import mmap
+import os
+from array import array
+
+from TwoLevelPageTableTLBSimulation import print_simulation_results, simulate_address_access
+
+ADDRESS_FORMATS = {4: 'I', 8: 'Q'}  # Address width in bytes -> array/memoryview type code
+CHUNK_SIZE = 65536  # Addresses per chunk
+
+
+def import_text_trace(text_path, binary_path, width=8, chunk_size=CHUNK_SIZE):
+    """
+    Convert a text trace (one decimal or 0x-prefixed hex address per line) into a packed binary trace.
+    Returns the number of addresses written.
+    """
+    type_code = ADDRESS_FORMATS[width]
+    count = 0
+    with open(text_path) as src, open(binary_path, "wb") as dst:
+        chunk = array(type_code)
+        for line in src:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            chunk.append(int(line, 0))
+            if len(chunk) == chunk_size:
+                chunk.tofile(dst)
+                count += len(chunk)
+                chunk = array(type_code)
+        chunk.tofile(dst)
+        count += len(chunk)
+    return count
+
+
+def iter_trace_chunks(binary_path, width=8, chunk_size=CHUNK_SIZE):
+    """
+    Memory-map a binary trace and yield it as memoryview chunks of at most chunk_size addresses.
+    The chunks point straight into the mapping (no copies) and are only valid until the next one is produced.
+    """
+    if os.path.getsize(binary_path) == 0:
+        return
+
+    with open(binary_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        if len(mapping) % width:
+            raise ValueError(f"Trace size is not a multiple of {width} bytes")
+        addresses = memoryview(mapping).cast(ADDRESS_FORMATS[width])
+        try:
+            for start in range(0, len(addresses), chunk_size):
+                chunk = addresses[start:start + chunk_size]
+                try:
+                    yield chunk
+                finally:
+                    chunk.release()
+        finally:
+            addresses.release()
+
+
+def replay_trace(binary_path, width=8, chunk_size=CHUNK_SIZE, verbose=False):
+    """
+    Replay a binary trace through simulate_address_access chunk by chunk and return the counters.
+    """
+    stats = {"accesses": 0, "tlb_hits": 0, "tlb_misses": 0}
+    for chunk in iter_trace_chunks(binary_path, width, chunk_size):
+        simulate_address_access(chunk, verbose=False, stats=stats)
+        if verbose:
+            print(f"Replayed {stats['accesses']} addresses, {stats['tlb_hits']} TLB hits so far")
+    return stats
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay a memory-mapped address trace through the TLB simulator.")
+    parser.add_argument("trace", help="binary trace file (or text trace with --import-text)")
+    parser.add_argument("--import-text", metavar="TEXT_TRACE", help="convert this text trace into TRACE first")
+    parser.add_argument("--width", type=int, choices=sorted(ADDRESS_FORMATS), default=8, help="bytes per address")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="addresses per chunk")
+    parser.add_argument("--progress", action="store_true", help="print the running counters after every chunk")
+    args = parser.parse_args()
+
+    if args.import_text:
+        count = import_text_trace(args.import_text, args.trace, args.width)
+        print(f"Imported {count} addresses into {args.trace}")
+
+    print_simulation_results(replay_trace(args.trace, args.width, args.chunk_size, args.progress))
@@ -4,141 +4,284 @@ Author: Rahul Kumar
 Date: November 2, 2024
 """
 
+import argparse
+import asyncio
+import queue
 import threading
 import time
 import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 
-# Constants for the number of writers, editors, and available review slots
+from LockInstrumentation import InstrumentedLock, InstrumentedSemaphore, print_contention_summary, print_histogram
+
+# Default number of writers, editors, and available review slots (override them on the command line)
 NUM_WRITERS = 5  # Number of writers to simulate
 NUM_EDITORS = 2  # Number of editors to simulate
 NUM_SLOTS = 3  # Maximum simultaneous reviews
+VERBOSE = True  # Print every event; turn off for load tests with many writers
+
+BACKENDS = ("threads", "pool", "asyncio", "process")
+REVIEW = "sleep"  # "sleep" simulates the review time; "cpu" does REVIEW_WORK iterations of real computation
+REVIEW_WORK = 200000
+TIME_SCALE = 1.0  # Multiplies the simulated drafting and review times
+review_executor = None  # Process pool that editors hand CPU-heavy reviews to (process backend)
 
 # Semaphore to manage available review slots
-review_slots = threading.Semaphore(NUM_SLOTS)
+# A writer takes a slot when submitting, and the editor gives it back once the review is done,
+# so at most NUM_SLOTS articles are waiting for or under review at any time
+review_slots = InstrumentedSemaphore("review_slots", NUM_SLOTS)
+
+# Bounded queue of submitted articles; editors block on it and wake up as soon as an article arrives
+review_queue = queue.Queue(maxsize=NUM_SLOTS)
 
-# Lock to ensure one editor reviews an article at a time
-editor_lock = threading.Lock()
+# Lock protecting the shared counters (held only for the update, never during a review)
+editor_lock = InstrumentedLock("editor_lock")
 
 # Lock to prevent overlapping print output
-print_lock = threading.Lock()
+print_lock = InstrumentedLock("print_lock")
 
 # Shared variables to track the submission and review process
 articles_submitted = 0  # Number of articles submitted
+articles_reviewed = 0  # Number of articles reviewed
 TOTAL_ARTICLES = NUM_WRITERS  # Total articles expected
+article_latencies = []  # Seconds from submission to the end of the review, per article
+
+# Sentinel put on the queue once per editor to tell it to stop
+STOP = None
+
 
-# Event to signal that all articles are reviewed
-stop_editors = threading.Event()
+@dataclass
+class Article:
+    """An article travelling from its writer to an editor."""
+    writer_id: int
+    submitted_at: float = 0.0
+    reviewed_at: float = 0.0
+
+
+def log(message):
+    """Print one event line; the console is a shared resource, so we need to lock it."""
+    if VERBOSE:
+        with print_lock:
+            print(message)
 
 
 def writer_task(writer_id):
     """Simulates a writer drafting and submitting an article."""
-    with print_lock:
-        print(f"Writer {writer_id} is drafting an article.")
+    log(f"Writer {writer_id} is drafting an article.")
 
     # Simulate drafting time
-    time.sleep(random.uniform(1, 2))
+    time.sleep(random.uniform(1, 2) * TIME_SCALE)
 
-    with print_lock:  # console is a shared resource, so we need to lock it
-        print(f"Writer {writer_id} is waiting for a review slot.")
+    log(f"Writer {writer_id} is waiting for a review slot.")
 
-    # TODO 1: Acquire the review slot before submission
+    # TODO 1: Acquire the review slot before submission (released by the editor after the review)
     review_slots.acquire()
 
-    with print_lock:  # console is a shared resource, so we need to lock it
-        print(f"Writer {writer_id} has submitted an article for review.")
-
     # TODO 2: Safely update the shared variable `articles_submitted` tracking the number of submitted articles
-    # Acquire the editor lock to ensure exclusive access to update shared variable `articles_submitted`
-    editor_lock.acquire()
-
-    # Mark this section as modifying a shared resource
-    global articles_submitted  # Use the global variable to increment the count of submitted articles
-    articles_submitted += 1  # Increment the counter for articles submitted
+    global articles_submitted
+    with editor_lock:
+        articles_submitted += 1
 
-    # Release the editor lock after updating `articles_submitted`
-    editor_lock.release()
-
-    # Safely print the submission message using print_lock to prevent output overlap
-    with print_lock:
-        print(f"Writer {writer_id} has provided an article for submission.")
-
-    # TODO 3: Release the review slot after submission
-    review_slots.release()
+    # TODO 3: Submit the article; the slot guarantees there is room in the queue
+    review_queue.put(Article(writer_id, submitted_at=time.monotonic()))
 
+    log(f"Writer {writer_id} has submitted an article for review.")
 
 
 def editor_task(editor_id):
-    """Simulates an editor reviewing articles."""
-    while not stop_editors.is_set():
-        # Simulate the time before checking for an article
-        time.sleep(random.uniform(0.5, 1.5))
-
-        with print_lock:  # console is a shared resource, so we need to lock it
-            print(f"Editor {editor_id} is checking for an article to review.")
-
-        # TODO 4: Acquire the editor lock with a timeout to avoid deadlock
-        # Attempt to acquire the editor lock with a random timeout to avoid deadlock
-        received = editor_lock.acquire(timeout=random.uniform(0.1, 0.5))
-
-        # Check if the lock was not acquired within the timeout period
-        if not received:
-            # If lock acquisition failed, print a message indicating a retry attempt
-            with print_lock:
-                print(f"Editor {editor_id} could not acquire lock. Trying once again.")
-
-            # Continue to the next iteration of the loop to retry lock acquisition
-            continue
-
-        try:
-            # TODO 5: Check if there are articles to review
-            global articles_submitted
-            if articles_submitted > 0:
-                with print_lock:  # console is a shared resource, so we need to lock it
-                    print(f"Editor {editor_id} is reviewing an article.")
-                time.sleep(random.uniform(1, 3))  # Simulate review time
-
-                with print_lock:  # console is a shared resource, so we need to lock it
-                    print(f"Editor {editor_id} has finished reviewing an article.")
-
-                # TODO 7: Safely decrement the number of submitted articles
-                articles_submitted -= 1
-
-                # TODO 8: Stop editors if all articles are reviewed
-                if articles_submitted <= 0:
-                    stop_editors.set()
-        finally:
-            # TODO 9: Ensure the editor lock is released
-            editor_lock.release()
-            '''
-            pass  # TODO 10: Remove this line after adding the code
-            '''
-
-    with print_lock:
-        print(f"Editor {editor_id} is stopping as all reviews are complete.")
-
-
-def main():
-    """Main function to initialize the simulation."""
-    writer_threads = []
-    for i in range(NUM_WRITERS):
-        t = threading.Thread(target=writer_task, args=(i,))
-        writer_threads.append(t)
-        t.start()
-
+    """Simulates an editor reviewing articles until it receives the stop sentinel."""
+    global articles_reviewed
+    while True:
+        # TODO 4: Wait for an article; get() blocks without polling and returns as soon as one is submitted
+        article = review_queue.get()
+        if article is STOP:
+            break
+
+        # TODO 5: Review outside of any lock, so editors review concurrently
+        log(f"Editor {editor_id} is reviewing an article from writer {article.writer_id}.")
+        review_article()
+        article.reviewed_at = time.monotonic()
+
+        log(f"Editor {editor_id} has finished reviewing an article.")
+
+        # TODO 6: Safely count the review, then give the review slot back to the writers
+        with editor_lock:
+            articles_reviewed += 1
+            article_latencies.append(article.reviewed_at - article.submitted_at)
+        review_slots.release()
+
+    log(f"Editor {editor_id} is stopping as all reviews are complete.")
+
+
+def cpu_review(work):
+    """CPU-heavy review: pure Python arithmetic, so threads running it contend for the GIL."""
+    checksum = 0
+    for i in range(work):
+        checksum = (checksum * 31 + i) % 1000003
+    return checksum
+
+
+def review_article():
+    """Review one article in the editor's thread, or in the process pool when there is one."""
+    if REVIEW == "cpu":
+        if review_executor is not None:
+            return review_executor.submit(cpu_review, REVIEW_WORK).result()
+        return cpu_review(REVIEW_WORK)
+    time.sleep(random.uniform(1, 3) * TIME_SCALE)  # Simulate review time
+
+
+def reset_simulation(num_slots=NUM_SLOTS):
+    """Recreate the slots, the queue and the counters for a run with num_slots review slots."""
+    global review_slots, review_queue, articles_submitted, articles_reviewed, article_latencies
+    review_slots = InstrumentedSemaphore("review_slots", num_slots)
+    review_queue = queue.Queue(maxsize=num_slots)
+    editor_lock.reset()
+    print_lock.reset()
+    articles_submitted = 0
+    articles_reviewed = 0
+    article_latencies = []
+
+
+def run_threads(num_writers, num_editors, writer_pool=None):
+    """One thread per editor; one thread per writer, or writer tasks on a bounded thread pool."""
     editor_threads = []
-    for i in range(NUM_EDITORS):
-        t = threading.Thread(target=editor_task, args=(i,))
+    for i in range(num_editors):
+        t = threading.Thread(target=editor_task, args=(i,), name=f"Editor-{i}")
         editor_threads.append(t)
         t.start()
 
-    for t in writer_threads:
-        t.join()
+    if writer_pool is None:
+        writer_threads = []
+        for i in range(num_writers):
+            t = threading.Thread(target=writer_task, args=(i,), name=f"Writer-{i}")
+            writer_threads.append(t)
+            t.start()
+
+        for t in writer_threads:
+            t.join()
+    else:
+        # Idle pool threads wait on review_slots like writer threads do, so the slot limit is unchanged
+        for future in [writer_pool.submit(writer_task, i) for i in range(num_writers)]:
+            future.result()
+
+    # Every article has been submitted: one sentinel per editor, queued behind the remaining articles
+    for _ in editor_threads:
+        review_queue.put(STOP)
 
     for t in editor_threads:
         t.join()
 
-    print("All articles have been submitted and reviewed.")
+
+async def writer_coroutine(writer_id, slots, articles):
+    """asyncio version of writer_task: one task per writer, no thread per writer."""
+    global articles_submitted
+    log(f"Writer {writer_id} is drafting an article.")
+    await asyncio.sleep(random.uniform(1, 2) * TIME_SCALE)
+    log(f"Writer {writer_id} is waiting for a review slot.")
+    await slots.acquire()  # Released by the editor after the review
+    articles_submitted += 1  # Tasks only switch at await, so no lock is needed
+    await articles.put(Article(writer_id, submitted_at=time.monotonic()))
+    log(f"Writer {writer_id} has submitted an article for review.")
+
+
+async def editor_coroutine(editor_id, slots, articles):
+    """asyncio version of editor_task; CPU-heavy reviews run in the loop's default thread pool."""
+    global articles_reviewed
+    loop = asyncio.get_running_loop()
+    while True:
+        article = await articles.get()
+        if article is STOP:
+            break
+        log(f"Editor {editor_id} is reviewing an article from writer {article.writer_id}.")
+        if REVIEW == "cpu":
+            await loop.run_in_executor(None, cpu_review, REVIEW_WORK)
+        else:
+            await asyncio.sleep(random.uniform(1, 3) * TIME_SCALE)
+        article.reviewed_at = time.monotonic()
+        log(f"Editor {editor_id} has finished reviewing an article.")
+        articles_reviewed += 1
+        article_latencies.append(article.reviewed_at - article.submitted_at)
+        slots.release()
+    log(f"Editor {editor_id} is stopping as all reviews are complete.")
+
+
+async def run_asyncio(num_writers, num_editors, num_slots):
+    """Writers and editors as tasks on one event loop, limited by an asyncio.Semaphore of num_slots."""
+    slots = asyncio.Semaphore(num_slots)
+    articles = asyncio.Queue(maxsize=num_slots)
+    editors = [asyncio.create_task(editor_coroutine(i, slots, articles)) for i in range(num_editors)]
+    await asyncio.gather(*(writer_coroutine(i, slots, articles) for i in range(num_writers)))
+    for _ in editors:
+        await articles.put(STOP)
+    await asyncio.gather(*editors)
+
+
+def main(num_writers=NUM_WRITERS, num_editors=NUM_EDITORS, num_slots=NUM_SLOTS, backend="threads",
+         verbose=True, review="sleep", workers=32, time_scale=1.0):
+    """
+    Main function to initialize the simulation.
+    backend: "threads" (a thread per writer and editor), "pool" (writers on a ThreadPoolExecutor of `workers`
+    threads), "asyncio" (a task per writer) or "process" (like "pool", with reviews run in a process pool;
+    it requires review="cpu", since sleeping reviews have nothing to hand to another process).
+    """
+    global VERBOSE, REVIEW, TIME_SCALE, review_executor
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    if backend == "process" and review != "cpu":
+        raise ValueError('The process backend needs CPU-heavy reviews (review="cpu")')
+    VERBOSE, REVIEW, TIME_SCALE = verbose, review, time_scale
+    reset_simulation(num_slots)
+    start_time = time.monotonic()
+
+    if backend == "threads":
+        run_threads(num_writers, num_editors)
+    elif backend == "asyncio":
+        asyncio.run(run_asyncio(num_writers, num_editors, num_slots))
+    else:
+        with ThreadPoolExecutor(workers, thread_name_prefix="Writer") as writer_pool:
+            if backend == "process":
+                with ProcessPoolExecutor(num_editors) as review_executor:
+                    run_threads(num_writers, num_editors, writer_pool)
+                review_executor = None
+            else:
+                run_threads(num_writers, num_editors, writer_pool)
+
+    elapsed = time.monotonic() - start_time
+    print(f"All {articles_reviewed} articles have been submitted and reviewed.")
+    print_simulation_report(elapsed, backend)
+
+
+def print_simulation_report(elapsed, backend="threads"):
+    """
+    Display throughput, article latency and the lock/semaphore contention statistics.
+    The asyncio backend uses a plain asyncio.Semaphore, so there is no contention to report for it.
+    """
+    print(f"\nElapsed: {elapsed:.2f} s, throughput: {articles_reviewed / elapsed:.2f} articles/s")
+    if article_latencies:
+        latencies = sorted(article_latencies)
+        print(f"Article latency (submit -> reviewed): mean {sum(latencies) / len(latencies):.3f} s, "
+              f"p50 {latencies[len(latencies) // 2]:.3f} s, max {latencies[-1]:.3f} s")
+    print_histogram("Article latency", article_latencies)
+    if backend == "asyncio":
+        print("\nLock contention is not measured for the asyncio backend.")
+    else:
+        print_contention_summary([review_slots, editor_lock, print_lock])
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Simulate writers submitting articles and editors reviewing them.")
+    parser.add_argument("--writers", type=int, default=NUM_WRITERS, help="number of writers")
+    parser.add_argument("--editors", type=int, default=NUM_EDITORS, help="number of editors")
+    parser.add_argument("--slots", type=int, default=NUM_SLOTS, help="maximum simultaneous reviews")
+    parser.add_argument("--backend", choices=BACKENDS, default="threads", help="how writers and editors are run")
+    parser.add_argument("--workers", type=int, default=32, help="writer threads for the pool and process backends")
+    parser.add_argument("--review", choices=("sleep", "cpu"), default="sleep", help="simulated or CPU-heavy reviews")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="multiplier for drafting and review times")
+    parser.add_argument("--quiet", action="store_true", help="do not print every event")
+    args = parser.parse_args()
+    if args.backend == "process" and args.review != "cpu":
+        parser.error("--backend process requires --review cpu")
+
+    main(args.writers, args.editors, args.slots, args.backend, not args.quiet, args.review, args.workers,
+         args.time_scale)
@@ -31,10 +31,11 @@ page_table = {i: {j: random.randint(0, 15) for j in range(
 tlb = OrderedDict()
 
 # Function to translate a virtual address to a physical address using bit manipulation
-def translate_address(virtual_address) -> tuple:
+def translate_address(virtual_address, verbose=True) -> tuple:
     """
     Translate a virtual address to a physical address using a two-level page table and TLB.
     Returns a tuple with the physical address and a boolean indicating if it was a TLB hit.
+    Set verbose to False to skip the per-lookup messages when replaying long traces.
     """
     # Extract Level 1 index, Level 2 index, and offset from the virtual address
     level_1_index = (virtual_address >> (LEVEL_2_BITS + OFFSET_BITS)) & LEVEL_1_MASK
@@ -52,7 +53,8 @@ def translate_address(virtual_address) -> tuple:
         physical_frame = tlb[(level_1_index, level_2_index)]
         # Update TLB for LRU by moving the accessed item to the end
         tlb.move_to_end((level_1_index, level_2_index))
-        print(f"TLB hit for virtual page ({level_1_index}, {level_2_index}).")
+        if verbose:
+            print(f"TLB hit for virtual page ({level_1_index}, {level_2_index}).")
 
         # TODO-2.1: Calculate the physical address using the frame number and offset
         physical_address = (physical_frame << OFFSET_BITS) | offset
@@ -65,12 +67,14 @@ def translate_address(virtual_address) -> tuple:
         physical_frame = page_table[level_1_index][level_2_index]
         # Add the entry to the TLB
         tlb[(level_1_index, level_2_index)] = physical_frame
-        print(f"TLB miss. Retrieved from page table for virtual page ({level_1_index}, {level_2_index}).")
+        if verbose:
+            print(f"TLB miss. Retrieved from page table for virtual page ({level_1_index}, {level_2_index}).")
 
         # TODO-4: If the TLB is full, evict the least recently used entry
         if len(tlb) > TLB_SIZE:
             evicted_page = tlb.popitem(last=False)
-            print(f"Evicted page {evicted_page} from TLB (LRU policy).")
+            if verbose:
+                print(f"Evicted page {evicted_page} from TLB (LRU policy).")
 
         # TODO-4.1: Calculate the physical address using the frame number and offset
         physical_address = (physical_frame << OFFSET_BITS) | offset
@@ -78,34 +82,53 @@ def translate_address(virtual_address) -> tuple:
         is_tlb_hit = False
 
     # If not in the page table, it's a page fault
-    else:
+    elif verbose:
         print(f"Page fault! Virtual page ({level_1_index}, {level_2_index}) is not in page table.")
 
     return physical_address, is_tlb_hit
 
 # Function to simulate address access patterns and calculate TLB performance
-def simulate_address_access(access_pattern):
+def simulate_address_access(access_pattern, verbose=True, stats=None):
     """
     Simulate address translation for a given access pattern and calculate TLB hit rate.
+    The access pattern can be any iterable of addresses. Counters are kept in the `stats` dict and
+    updated incrementally, so a long trace can be fed in chunks by passing the same dict each time
+    (with verbose=False to skip per-access messages and the summary).
+    Returns the counters.
     """
+    if stats is None:
+        stats = {"accesses": 0, "tlb_hits": 0, "tlb_misses": 0}
     tlb_hits = 0
     tlb_misses = 0
 
     for virtual_address in access_pattern:
         # Translate the virtual address to a physical address
-        physical_address, was_tlb_hit = translate_address(virtual_address)
+        physical_address, was_tlb_hit = translate_address(virtual_address, verbose)
         if was_tlb_hit:
             tlb_hits += 1
         else:
             tlb_misses += 1
 
+    stats["accesses"] += tlb_hits + tlb_misses
+    stats["tlb_hits"] += tlb_hits
+    stats["tlb_misses"] += tlb_misses
+
+    if verbose:
+        print_simulation_results(stats)
+    return stats
+
+# Function to print the TLB performance counters
+def print_simulation_results(stats):
+    """
+    Print the access counts and TLB hit rate collected by simulate_address_access.
+    """
     # Calculate and print the TLB hit rate
     print("\nSimulation Results:")
-    print(f"Total Accesses: {len(access_pattern)}")
-    print(f"TLB Hits: {tlb_hits}")
-    print(f"TLB Misses: {tlb_misses}")
+    print(f"Total Accesses: {stats['accesses']}")
+    print(f"TLB Hits: {stats['tlb_hits']}")
+    print(f"TLB Misses: {stats['tlb_misses']}")
     # TODO-5: Calculate and print the TLB hit rate
-    hit_rate = (tlb_hits / len(access_pattern)) * 100 if len(access_pattern) > 0 else 0
+    hit_rate = (stats['tlb_hits'] / stats['accesses']) * 100 if stats['accesses'] > 0 else 0
     print(f"TLB Hit Rate: {hit_rate:.2f}%")
 
 # Main function to run multiple test cases with different access patterns
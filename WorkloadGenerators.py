@@ -0,0 +1,189 @@
+"""
+This program generates large synthetic inputs for the schedulers and the TLB simulators with NumPy.
+Scheduler workloads have Poisson arrivals (exponential gaps) and heavy-tailed Pareto burst times.
+Address traces follow Zipfian, strided, working-set-shift or looped access patterns. Every generator takes
+a seed, produces its output in fixed-size chunks so 10^8-event inputs never have to fit in memory (each random
+quantity comes from its own stream, so the output depends only on the seed, not on the chunk size), and can be
+saved in a compact binary format: traces use the packed address format replayed by TLBTraceReplay.py and
+workloads use 16-byte (process_id, burst_time, arrival_time) records that can be memory-mapped back.
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import argparse
+import os
+
+import numpy as np  # For vectorized random number generation
+
+from TLBTraceReplay import ADDRESS_FORMATS
+from TwoLevelPageTableTLBSimulation import FRAME_SIZE, PAGE_TABLE_LEVEL_1_SIZE, PAGE_TABLE_LEVEL_2_SIZE
+
+CHUNK_SIZE = 1 << 20  # Events generated per chunk
+NUM_PAGES = PAGE_TABLE_LEVEL_1_SIZE * PAGE_TABLE_LEVEL_2_SIZE  # Pages of the simulator's address space
+WORKLOAD_DTYPE = np.dtype([("process_id", "<u4"), ("burst_time", "<u4"), ("arrival_time", "<u8")])
+TRACE_PATTERNS = ("zipf", "strided", "working-set", "looped")
+
+
+def generate_workload(num_processes, seed=None, arrival_rate=1.0, burst_shape=1.5, min_burst=1, max_burst=10 ** 6,
+                      chunk_size=CHUNK_SIZE):
+    """
+    Yield chunks of a workload as WORKLOAD_DTYPE arrays. Gaps between arrivals are exponential with mean
+    1 / arrival_rate (a Poisson arrival process); bursts are Pareto with shape burst_shape (heavier tail
+    for smaller shapes) scaled to start at min_burst and capped at max_burst.
+    """
+    if arrival_rate <= 0 or burst_shape <= 0 or not 1 <= min_burst <= max_burst < 2 ** 32:
+        raise ValueError("Invalid arrival rate, burst shape or burst range")
+    gap_rng, burst_rng = _streams(seed, 2)
+    clock = 0.0  # Arrival time of the last process of the previous chunk
+    for start in range(0, num_processes, chunk_size):
+        count = min(chunk_size, num_processes - start)
+        chunk = np.empty(count, dtype=WORKLOAD_DTYPE)
+        chunk["process_id"] = np.arange(start + 1, start + count + 1)
+        arrivals = clock + np.cumsum(gap_rng.exponential(1 / arrival_rate, count))
+        clock = arrivals[-1]
+        chunk["arrival_time"] = np.floor(arrivals)
+        bursts = np.ceil(min_burst * (1 + burst_rng.pareto(burst_shape, count)))
+        chunk["burst_time"] = np.minimum(bursts, max_burst)
+        yield chunk
+
+
+def _streams(seed, count):
+    # Independent generators for the random quantities of one generator. Each stream is drawn from in order,
+    # so splitting its draws into chunks of any size gives the same values
+    return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(count)]
+
+
+def _with_offsets(rng, pages, page_size):
+    # Turn page numbers into byte addresses with a random offset inside each page
+    return pages.astype(np.uint64) * np.uint64(page_size) + rng.integers(0, page_size, len(pages), dtype=np.uint64)
+
+
+def zipf_trace(count, num_pages=NUM_PAGES, alpha=1.0, page_size=FRAME_SIZE, seed=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield chunks of addresses whose pages follow a Zipf distribution over num_pages pages: the k-th most
+    popular page is accessed with probability proportional to 1 / k^alpha. Popularity ranks are shuffled
+    over the address space, so the hot pages are not simply the lowest ones.
+    """
+    permutation_rng, rank_rng, offset_rng = _streams(seed, 3)
+    weights = 1.0 / np.arange(1, num_pages + 1) ** alpha
+    cdf = np.cumsum(weights / weights.sum())
+    page_of_rank = permutation_rng.permutation(num_pages)
+    for start in range(0, count, chunk_size):
+        ranks = np.searchsorted(cdf, rank_rng.random(min(chunk_size, count - start)), side="right")
+        yield _with_offsets(offset_rng, page_of_rank[np.minimum(ranks, num_pages - 1)], page_size)
+
+
+def strided_trace(count, stride=FRAME_SIZE, start_address=0, address_space=NUM_PAGES * FRAME_SIZE,
+                  chunk_size=CHUNK_SIZE):
+    """Yield chunks of addresses start_address, start_address + stride, ... wrapping around the address space."""
+    for start in range(0, count, chunk_size):
+        index = np.arange(start, min(start + chunk_size, count), dtype=np.uint64)
+        yield (np.uint64(start_address) + index * np.uint64(stride)) % np.uint64(address_space)
+
+
+def working_set_trace(count, num_pages=NUM_PAGES, working_set_size=4, phase_length=10000, page_size=FRAME_SIZE,
+                      seed=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield chunks of addresses drawn uniformly from a working set of working_set_size pages that is replaced
+    by a new random set of pages every phase_length accesses (a program moving between phases).
+    """
+    if not 0 < working_set_size <= num_pages:
+        raise ValueError("The working set must hold between 1 and num_pages pages")
+    set_rng, slot_rng, offset_rng = _streams(seed, 3)
+    current_phase, current_set = -1, None  # A phase can continue from the previous chunk
+    for start in range(0, count, chunk_size):
+        index = np.arange(start, min(start + chunk_size, count))
+        phases = index // phase_length
+        # One working set per phase touched by this chunk
+        first, last = phases[0], phases[-1]
+        working_sets = [current_set if phase == current_phase
+                        else set_rng.choice(num_pages, working_set_size, replace=False)
+                        for phase in range(first, last + 1)]
+        current_phase, current_set = last, working_sets[-1]
+        working_sets = np.stack(working_sets)
+        slots = slot_rng.integers(0, working_set_size, len(index))
+        yield _with_offsets(offset_rng, working_sets[phases - first, slots], page_size)
+
+
+def looped_trace(count, loop_pages=10, page_size=FRAME_SIZE, chunk_size=CHUNK_SIZE):
+    """Yield chunks of addresses that sweep the first loop_pages pages in order, over and over."""
+    for start in range(0, count, chunk_size):
+        index = np.arange(start, min(start + chunk_size, count), dtype=np.uint64)
+        yield (index % np.uint64(loop_pages)) * np.uint64(page_size)
+
+
+def write_chunks(chunks, path, dtype):
+    """Write generated chunks to a binary file as `dtype` records; returns the number of records written."""
+    count = 0
+    with open(path, "wb") as f:
+        for chunk in chunks:
+            np.asarray(chunk).astype(dtype, copy=False).tofile(f)
+            count += len(chunk)
+    return count
+
+
+def write_trace(chunks, path, width=8):
+    """Save an address trace in the packed format read by TLBTraceReplay.py (native-order uint32 or uint64)."""
+    return write_chunks(chunks, path, np.dtype(ADDRESS_FORMATS[width]))
+
+
+def write_workload(chunks, path):
+    """Save workload chunks as WORKLOAD_DTYPE records."""
+    return write_chunks(chunks, path, WORKLOAD_DTYPE)
+
+
+def iter_workload_chunks(path, chunk_size=CHUNK_SIZE):
+    """Memory-map a binary workload file and yield it in chunks of WORKLOAD_DTYPE records."""
+    if os.path.getsize(path) == 0:
+        return  # np.memmap cannot map an empty file
+    records = np.memmap(path, dtype=WORKLOAD_DTYPE, mode="r")
+    for start in range(0, len(records), chunk_size):
+        yield records[start:start + chunk_size]
+
+
+def load_binary_workload(path):
+    """Read a binary workload file into the [process_id, burst_time, arrival_time] lists the schedulers take."""
+    processes = []
+    for chunk in iter_workload_chunks(path):
+        processes.extend(np.column_stack((chunk["process_id"], chunk["burst_time"], chunk["arrival_time"])).tolist())
+    return processes
+
+
+def make_trace(pattern, count, seed=None, **options):
+    """Return the chunk generator of one of the TRACE_PATTERNS."""
+    if pattern == "zipf":
+        return zipf_trace(count, seed=seed, **options)
+    if pattern == "strided":
+        return strided_trace(count, **options)
+    if pattern == "working-set":
+        return working_set_trace(count, seed=seed, **options)
+    if pattern == "looped":
+        return looped_trace(count, **options)
+    raise ValueError(f"Unknown trace pattern: {pattern}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic workloads and address traces.")
+    subparsers = parser.add_subparsers(dest="kind", required=True)
+
+    workload_parser = subparsers.add_parser("workload", help="scheduler workload with Poisson arrivals")
+    workload_parser.add_argument("output", help="binary workload file to write")
+    workload_parser.add_argument("--count", type=int, default=10 ** 6, help="number of processes")
+    workload_parser.add_argument("--arrival-rate", type=float, default=1.0, help="mean arrivals per time unit")
+    workload_parser.add_argument("--burst-shape", type=float, default=1.5, help="Pareto shape of the burst times")
+    workload_parser.add_argument("--seed", type=int, default=None, help="random seed")
+
+    trace_parser = subparsers.add_parser("trace", help="address trace for TLBTraceReplay.py")
+    trace_parser.add_argument("pattern", choices=TRACE_PATTERNS, help="access pattern")
+    trace_parser.add_argument("output", help="binary trace file to write")
+    trace_parser.add_argument("--count", type=int, default=10 ** 6, help="number of addresses")
+    trace_parser.add_argument("--width", type=int, choices=sorted(ADDRESS_FORMATS), default=8, help="bytes per address")
+    trace_parser.add_argument("--seed", type=int, default=None, help="random seed")
+    args = parser.parse_args()
+
+    if args.kind == "workload":
+        written = write_workload(generate_workload(args.count, args.seed, args.arrival_rate, args.burst_shape),
+                                 args.output)
+    else:
+        written = write_trace(make_trace(args.pattern, args.count, args.seed), args.output, args.width)
+    print(f"Wrote {written} records to {args.output}")
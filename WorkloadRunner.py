@@ -0,0 +1,129 @@
+"""
+This program runs large numbers of I/O-bound and CPU-bound tasks on persistent worker pools.
+Instead of starting a new process per task as Multiprocessing.py does, CPU-bound tasks are routed to a
+process pool that is created once, and I/O-bound tasks to a thread pool, since threads waiting for I/O
+release the GIL. Directory listings are done in-process with os.scandir instead of forking a shell for "ls".
+Author: Rahul Kumar
+Date: October 18, 2026
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
+TASK_TYPES = ("io", "cpu")
+
+
+@dataclass
+class TaskResult:
+    """What one task did, where it ran and when (time.time() timestamps)."""
+    name: str
+    kind: str
+    pid: int
+    thread: str
+    start: float
+    end: float
+    result: object = None
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+def list_directory(path="."):
+    """Return the sorted entry names of a directory, read in-process with os.scandir."""
+    with os.scandir(path) as entries:
+        return sorted(entry.name for entry in entries)
+
+
+def io_bound_task(name, path=".", io_wait_time=0.0):
+    """List a directory, then wait io_wait_time seconds to simulate more I/O."""
+    start = time.time()
+    entries = list_directory(path)
+    time.sleep(io_wait_time)
+    return TaskResult(name, "io", os.getpid(), threading.current_thread().name, start, time.time(), len(entries))
+
+
+def cpu_bound_task(name, n=10 ** 6):
+    """Calculate the sum of all integers from 1 to n - 1."""
+    start = time.time()
+    result = sum(range(1, n))
+    return TaskResult(name, "cpu", os.getpid(), threading.current_thread().name, start, time.time(), result)
+
+
+class WorkloadRunner:
+    """
+    Routes tasks by their declared type: "cpu" tasks to a persistent process pool and "io" tasks to a
+    thread pool. Both pools are created once and reused for every task until close().
+    """
+
+    def __init__(self, cpu_workers=None, io_workers=32):
+        self.cpu_pool = Pool(cpu_workers or os.cpu_count())
+        self.io_pool = ThreadPool(io_workers)
+
+    def submit(self, kind, name, *args):
+        """Queue one task and return its AsyncResult; args are passed to the task function after the name."""
+        if kind == "cpu":
+            return self.cpu_pool.apply_async(cpu_bound_task, (name,) + args)
+        if kind == "io":
+            return self.io_pool.apply_async(io_bound_task, (name,) + args)
+        raise ValueError(f"Unknown task type: {kind}")
+
+    def run(self, tasks):
+        """Run an iterable of (kind, name, *args) tasks and return their TaskResults in submission order."""
+        pending = [self.submit(*task) for task in tasks]
+        return [result.get() for result in pending]
+
+    def close(self):
+        self.cpu_pool.close()
+        self.io_pool.close()
+        self.cpu_pool.join()
+        self.io_pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def make_tasks(num_io_tasks, num_cpu_tasks, io_wait=(1, 5), path=".", cpu_n=10 ** 6):
+    """Build a mixed task list like Multiprocessing.py's, with random I/O wait times in the io_wait range."""
+    tasks = [("io", f"IO-Worker-{i}", path, random.uniform(*io_wait)) for i in range(num_io_tasks)]
+    tasks += [("cpu", f"CPU-Worker-{i}", cpu_n) for i in range(num_cpu_tasks)]
+    return tasks
+
+
+def print_runner_summary(results, elapsed):
+    """Display the number of tasks, processes and threads used, and the time per task type."""
+    for kind in TASK_TYPES:
+        kind_results = [r for r in results if r.kind == kind]
+        if not kind_results:
+            continue
+        busy = sum(r.duration for r in kind_results)
+        workers = len({(r.pid, r.thread) for r in kind_results})
+        print(f"{kind.upper()} tasks: {len(kind_results)} on {workers} workers, {busy:.2f} s of task time")
+    print(f"All tasks finished. Total execution time: {elapsed:.2f} seconds")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run I/O-bound and CPU-bound tasks on persistent worker pools.")
+    parser.add_argument("--io-tasks", type=int, default=5, help="number of I/O-bound tasks")
+    parser.add_argument("--cpu-tasks", type=int, default=5, help="number of CPU-bound tasks")
+    parser.add_argument("--cpu-workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--io-workers", type=int, default=32, help="worker threads for I/O-bound tasks")
+    parser.add_argument("--io-wait", type=float, nargs=2, default=[1, 5], metavar=("MIN", "MAX"),
+                        help="range of the simulated I/O wait in seconds")
+    parser.add_argument("--path", default=".", help="directory listed by the I/O-bound tasks")
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.io_tasks, args.cpu_tasks, args.io_wait, args.path)
+    start_time = time.time()
+    with WorkloadRunner(args.cpu_workers, args.io_workers) as runner:
+        results = runner.run(tasks)
+    print_runner_summary(results, time.time() - start_time)